@@ -0,0 +1,103 @@
+"""Measures the per-call overhead examples add on top of the function they call, comparing
+each example's prebuilt call plan against re-inspecting the example on every run, as
+examples did before call plans were introduced. The function called directly, without any
+example, is the baseline both are measured against.
+
+Run from the project root with: `python benchmarks/call_plans.py`
+"""
+import inspect
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from examples import example  # noqa: E402
+from examples.api import get_examples  # noqa: E402
+from examples.example_objects import NotDefined  # noqa: E402
+
+CALLS = 200_000
+
+
+@example(_example_returns=1)
+def no_arguments() -> int:
+    return 1
+
+
+@example(1, 2, _example_returns=3)
+def positional(first: int, second: int) -> int:
+    return first + second
+
+
+@example(1, second=2, _example_returns=[1, 2])
+def keywords(first: int, second: int = 0) -> list:
+    return [first, second]
+
+
+@example(_example_raises=KeyError("missing"))
+def raises() -> None:
+    raise KeyError("missing")
+
+
+def unplanned_use(example_to_run):
+    """Calls the example the way `CallableExample.use` did before call plans."""
+    if inspect.iscoroutinefunction(example_to_run.callable_object):  # pragma: no cover
+        raise NotImplementedError("Only regular functions are measured.")
+    return example_to_run.callable_object(*example_to_run.args, **example_to_run.kwargs)
+
+
+def unplanned_run(example_to_run) -> None:
+    """Tests the example the way `CallableExample.test` did before call plans, inspecting the
+    example on every run and comparing return values with `!=`.
+    """
+    try:
+        result = unplanned_use(example_to_run)
+    except BaseException as exception:
+        raises = example_to_run.raises
+        if not raises:
+            raise
+        if (type(raises) == type and not isinstance(exception, raises)) or (
+            type(raises) != type
+            and (not isinstance(exception, type(raises)) or raises.args != exception.args)
+        ):
+            raise AssertionError("unexpected exception")
+        return
+    if example_to_run.raises:
+        raise AssertionError("expected an exception")
+    elif example_to_run.returns is not NotDefined:
+        if result != example_to_run.returns:
+            raise AssertionError("unexpected result")
+
+
+def nanoseconds_per_call(statement: str, **names) -> float:
+    return min(timeit.repeat(statement, number=CALLS, repeat=5, globals=names)) / CALLS * 1e9
+
+
+def main() -> None:
+    print(f"{'function':<14}{'direct':>10}{'unplanned':>12}{'planned':>10}{'saved':>10}")
+    for function in (no_arguments, positional, keywords, raises):
+        (function_example,) = get_examples(function)
+        call = "function(*args, **kwargs)"
+        if function_example.raises:
+            call = f"try:\n    {call}\nexcept KeyError:\n    pass"
+
+        direct = nanoseconds_per_call(
+            call,
+            function=function,
+            args=function_example.args,
+            kwargs=dict(function_example.kwargs),
+        )
+        unplanned = nanoseconds_per_call(
+            "unplanned_run(example)", unplanned_run=unplanned_run, example=function_example
+        )
+        planned = nanoseconds_per_call("run()", run=function_example._run_and_check)
+        overhead_saved = 1 - (planned - direct) / (unplanned - direct)
+        print(
+            f"{function.__name__:<14}{direct:>8.0f}ns{unplanned:>10.0f}ns{planned:>8.0f}ns"
+            f"{overhead_saved:>10.0%}"
+        )
+    print("\nOverhead saved is the share of time spent outside the function that was removed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Compares import time and memory of a module with thousands of examples with examples
+enabled (the default) vs. disabled through `EXAMPLES_ENABLED=0` (production mode).
+
+Run from the project root with: `python benchmarks/production_mode.py`
+"""
+import compileall
+import json
+import os
+import subprocess  # nosec
+import sys
+import tempfile
+
+FUNCTIONS = 1000
+EXAMPLES_PER_FUNCTION = 5
+
+MEASURE_IMPORT = """
+import json
+import sys
+import time
+import tracemalloc
+
+import examples
+
+start = time.perf_counter()
+import many_examples
+seconds = time.perf_counter() - start
+
+del many_examples
+del sys.modules["many_examples"]
+examples.registry.module_registry.clear()
+tracemalloc.start()
+import many_examples
+current, peak = tracemalloc.get_traced_memory()
+print(json.dumps({"seconds": seconds, "current": current, "peak": peak}))
+"""
+
+
+def write_module(directory: str) -> None:
+    with open(os.path.join(directory, "many_examples.py"), "w") as module:
+        module.write("from examples import example\n\n")
+        for function_index in range(FUNCTIONS):
+            for example_index in range(EXAMPLES_PER_FUNCTION):
+                module.write(
+                    f"@example({example_index}, list(range({example_index * 10})), "
+                    f"_example_returns={example_index + example_index * 10})\n"
+                )
+            module.write(
+                f"def function_{function_index}(number: int, numbers: list) -> int:\n"
+                f'    """Function number {function_index}."""\n'
+                "    return number + len(numbers)\n\n\n"
+            )
+
+
+def measure(directory: str, enabled: bool) -> dict:
+    """Imports the module in a fresh interpreter, timing the import then measuring the memory
+    allocated by a second import (so the memory measurement doesn't distort the timing).
+    """
+    environment = dict(os.environ, EXAMPLES_ENABLED="1" if enabled else "0")
+    environment["PYTHONPATH"] = os.pathsep.join(
+        (directory, os.getcwd(), environment.get("PYTHONPATH", ""))
+    )
+    output = subprocess.check_output(  # nosec
+        (sys.executable, "-c", MEASURE_IMPORT), env=environment
+    )
+    return json.loads(output)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        write_module(directory)
+        compileall.compile_dir(directory, quiet=1)
+        enabled = measure(directory, enabled=True)
+        disabled = measure(directory, enabled=False)
+
+    print(f"{FUNCTIONS * EXAMPLES_PER_FUNCTION} examples across {FUNCTIONS} functions")
+    for name, result in (("enabled", enabled), ("disabled", disabled)):
+        print(
+            f"{name:>9}: {result['seconds'] * 1000:8.1f}ms import, "
+            f"{result['current'] / 1024:8.0f}KiB retained, {result['peak'] / 1024:8.0f}KiB peak"
+        )
+    print(
+        f"  savings: {enabled['seconds'] / disabled['seconds']:.1f}x faster import, "
+        f"{(enabled['current'] - disabled['current']) / 1024:.0f}KiB less retained memory"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,9 @@ from examples.api import (
     add_example_to,
     example,
     get_examples,
+    lazy,
+    render_docs,
+    select_examples,
     test_all_examples,
     test_examples,
     verify_all_signatures,
@@ -9,20 +12,39 @@ from examples.api import (
     verify_and_test_examples,
     verify_signatures,
 )
+from examples.benchmark import benchmark_examples, compare_implementations
+from examples.catalog import Catalog, export_catalog
+from examples.config import configure
+from examples.discovery import discover
+from examples.fixtures import mapped
+from examples.load import replay_examples
 from examples.registry import Examples
+from examples.results import ExampleResults
 
 __version__ = "1.0.2"
 __all__ = [
     "__version__",
     "add_example_to",
+    "benchmark_examples",
+    "compare_implementations",
+    "configure",
+    "discover",
     "example",
+    "export_catalog",
     "example_returns",
     "get_examples",
+    "lazy",
+    "mapped",
+    "replay_examples",
+    "render_docs",
+    "select_examples",
     "verify_signatures",
     "test_examples",
     "verify_and_test_examples",
     "verify_all_signatures",
     "test_all_examples",
     "verify_and_test_all_examples",
+    "Catalog",
     "Examples",
+    "ExampleResults",
 ]
@@ -0,0 +1,5 @@
+import sys
+
+from examples.cli import main
+
+sys.exit(main())
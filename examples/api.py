@@ -1,9 +1,10 @@
 from functools import singledispatch
 from types import FunctionType, ModuleType
-from typing import Any, Callable, List
+from typing import Any, Callable, Iterable, List, Optional
 
-from examples import registry
-from examples.example_objects import CallableExample, NotDefined
+from examples import config, registry
+from examples.example_objects import CallableExample, Lazy, NotDefined
+from examples.results import ExampleResults
 
 
 def example(
@@ -11,6 +12,10 @@ def example(
     _example_returns: Any = NotDefined,
     _example_raises: Any = None,
     _example_doc_string: bool = True,
+    _example_max_seconds: Optional[float] = None,
+    _example_max_memory: Optional[int] = None,
+    _example_tags: Iterable[str] = (),
+    _example_tolerance: Optional[float] = None,
     **kwargs,
 ) -> Callable:
     """A decorator that adds an example to the decorated function.
@@ -23,20 +28,65 @@ def example(
     - *_example_returns*: The exact result you expect the example to return.
     - *_example_raises*: An exception you expect the example to raise (can't be combined with above)
     - *_example_doc_string*: If True example is added to the functions doc string.
+    - *_example_max_seconds*: A wall-clock budget, in seconds, the example must complete within.
+    - *_example_max_memory*: A budget, in bytes, for the peak memory the example may allocate
+      (as measured by `tracemalloc`).
+    - *_example_tags*: Tags that can be used to select the example, see `select_examples`.
+    - *_example_tolerance*: A relative (or near zero, absolute) tolerance within which numbers
+      returned, including those within containers and numpy arrays, match those expected.
+      See `examples.comparison.compare`, which can also be extended to compare your own types.
+
+    Budgets are checked whenever the example is tested, with no measurement overhead for
+    examples that don't set them.
+
+    When examples are disabled through `examples.configure(enabled=False)` the function is
+    returned untouched.
     """
+    if not config.enabled:
+        return registry._return_unchanged
 
     def wrap_example(function: Callable) -> Callable:
-        attached_module_name = function.__module__
-        if attached_module_name not in registry.module_registry:
-            registry.module_registry[attached_module_name] = registry.Examples()
-        module_registry = registry.module_registry[attached_module_name]
+        module_registry = registry.registry_for(function.__module__)
         return module_registry.example(
-            *args, _example_returns=_example_returns, _example_raises=_example_raises, **kwargs
+            *args,
+            _example_returns=_example_returns,
+            _example_raises=_example_raises,
+            _example_max_seconds=_example_max_seconds,
+            _example_max_memory=_example_max_memory,
+            _example_tags=_example_tags,
+            _example_tolerance=_example_tolerance,
+            **kwargs,
         )(function)
 
     return wrap_example
 
 
+def lazy(factory: Callable[[], Any], cache: bool = True, name: str = "") -> Lazy:
+    """Wraps a factory for an expensive example argument, or return value, so that it's only
+       created when the example is actually used, verified, or tested:
+
+            @example(lazy(load_big_matrix), _example_returns=lazy(load_big_matrix_total))
+            def total(matrix: Matrix) -> float:
+
+       Until then nothing but the factory is kept, and rendered examples show `name()`.
+
+       - *cache*: If `True` the created value is kept for reuse, with at most
+         `lazy_cache_size` values (see `examples.configure`) being kept at once.
+       - *name*: The name to show for the value, defaulting to the name of the factory.
+    """
+    return Lazy(factory, cache=cache, name=name)
+
+
+def _run_tests(examples: Any, **run_options) -> Optional[ExampleResults]:
+    from examples import runner  # imported on first use, keeping `import examples` fast
+
+    return runner.run_tests(examples, **run_options)
+
+
+def _ignore_example(*args, **kwargs) -> None:
+    return None
+
+
 def add_example_to(function: Callable) -> Callable:
     """Returns a function that when called will add an example to the provide function.
 
@@ -54,13 +104,22 @@ def add_example_to(function: Callable) -> Callable:
     it returns the produced examples, allowing you to expose it:
 
             add_example = add_example_to(my_sum_function)(1, 1)
+
+    When examples are disabled through `examples.configure(enabled=False)` no examples are
+    created and the returned function gives back `None`.
     """
+    if not config.enabled:
+        return _ignore_example
 
     def example_factory(
         *args,
         _example_returns: Any = NotDefined,
         _example_raises: Any = None,
         _example_doc_string: bool = True,
+        _example_max_seconds: Optional[float] = None,
+        _example_max_memory: Optional[int] = None,
+        _example_tags: Iterable[str] = (),
+        _example_tolerance: Optional[float] = None,
         **kwargs,
     ) -> CallableExample:
         example(
@@ -68,6 +127,10 @@ def add_example_to(function: Callable) -> Callable:
             _example_returns=_example_returns,
             _example_raises=_example_raises,
             _example_doc_string=_example_doc_string,
+            _example_max_seconds=_example_max_seconds,
+            _example_max_memory=_example_max_memory,
+            _example_tags=_example_tags,
+            _example_tolerance=_example_tolerance,
             **kwargs,
         )(function)
         return get_examples(function)[-1]
@@ -106,10 +169,28 @@ def _get_examples_module(item: ModuleType) -> List[CallableExample]:
     return _get_examples_module_name(item.__name__)
 
 
+def select_examples(
+    package: Optional[str] = None, qualname: Optional[str] = None, tags: Iterable[str] = ()
+) -> List[CallableExample]:
+    """Returns all examples matching every one of the given criteria, using indexes so that
+       selecting stays cheap no matter how many examples are registered.
+       The returned list can be passed into any of the verifying or testing functions.
+
+       - *package*: Only select examples from this module or package (including subpackages).
+       - *qualname*: Only select examples of functions with this `__qualname__`.
+       - *tags*: Only select examples that were given all of these `_example_tags`.
+    """
+    module_names = registry.modules_in(package) if package else list(registry.module_registry)
+    selected: List[CallableExample] = []
+    for module_name in module_names:
+        selected.extend(registry.module_registry[module_name].select(qualname=qualname, tags=tags))
+    return selected
+
+
 @singledispatch
 def verify_signatures(item: Any, verify_types: bool = True) -> None:
     """Verifies the signature of all examples associated with the provided item.
-       Provided item should be of type function, module, or module name.
+       Provided item should be of type function, module, module name, or list of examples.
 
        - *verify_types*: If `True` all examples will have have their types checked against
          their associated functions type annotations.
@@ -149,19 +230,35 @@ def _verify_function_signature(item: FunctionType, verify_types: bool = True) ->
         function_example.verify_signature(verify_types=verify_types)
 
 
+@verify_signatures.register(list)
+def _verify_selected_signatures(item: List[CallableExample], verify_types: bool = True) -> None:
+    """Verify signatures of the provided examples, such as those from `select_examples`."""
+    if not item:
+        raise ValueError("Tried verifying example signatures but no examples were provided.")
+
+    for selected_example in item:
+        selected_example.verify_signature(verify_types=verify_types)
+
+
 @singledispatch
-def test_examples(item: Any, verify_return_type: bool = True) -> None:
+def test_examples(
+    item: Any, verify_return_type: bool = True, **run_options
+) -> Optional[ExampleResults]:
     """Run all examples verifying they work as defined against the associated function.
-       Provided item should be of type function, module, or module name.
+       Provided item should be of type function, module, module name, or list of examples.
 
        - *verify_return_type*: If `True` all examples will have have their return value types
          checked against their associated functions type annotations.
+       - *run_options*: Control how the examples are run, such as `workers` or `gather_async`.
+         See `examples.runner.run_tests` for all supported options.
     """
     raise NotImplementedError(f"Currently examples can not be attached to {type(item)}.")
 
 
 @test_examples.register(str)
-def _test_module_name_examples(item: str, verify_return_type: bool = True) -> None:
+def _test_module_name_examples(
+    item: str, verify_return_type: bool = True, **run_options
+) -> Optional[ExampleResults]:
     """Tests all examples associated with the provided module name."""
     module_examples = registry.module_registry.get(item, None)
     if not module_examples:
@@ -169,17 +266,23 @@ def _test_module_name_examples(item: str, verify_return_type: bool = True) -> No
             f"Tried testing example for {item} module but "
             "no examples are defined for that module."
         )
-    module_examples.test_examples(verify_return_type=verify_return_type)
+    return module_examples.test_examples(verify_return_type=verify_return_type, **run_options)
 
 
 @test_examples.register(ModuleType)
-def _test_module_examples(item: ModuleType, verify_return_type: bool = True) -> None:
+def _test_module_examples(
+    item: ModuleType, verify_return_type: bool = True, **run_options
+) -> Optional[ExampleResults]:
     """Tests all examples associated with the provided module."""
-    _test_module_name_examples(item.__name__, verify_return_type=verify_return_type)
+    return _test_module_name_examples(
+        item.__name__, verify_return_type=verify_return_type, **run_options
+    )
 
 
 @test_examples.register(FunctionType)
-def _test_function_examples(item: FunctionType, verify_return_type: bool = True) -> None:
+def _test_function_examples(
+    item: FunctionType, verify_return_type: bool = True, **run_options
+) -> Optional[ExampleResults]:
     """Tests all examples associated with the provided function."""
     examples = get_examples(item)
     if not examples:
@@ -188,24 +291,40 @@ def _test_function_examples(item: FunctionType, verify_return_type: bool = True)
             "no examples are defined for that function."
         )
 
-    for function_example in examples:
-        function_example.test(verify_return_type=verify_return_type)
+    return _run_tests(examples, verify_return_type=verify_return_type, **run_options)
+
+
+@test_examples.register(list)
+def _test_selected_examples(
+    item: List[CallableExample], verify_return_type: bool = True, **run_options
+) -> Optional[ExampleResults]:
+    """Tests the provided examples, such as those from `select_examples`."""
+    if not item:
+        raise ValueError("Tried testing examples but no examples were provided.")
+
+    return _run_tests(item, verify_return_type=verify_return_type, **run_options)
 
 
 @singledispatch
-def verify_and_test_examples(item: Any, verify_return_type: bool = True) -> None:
+def verify_and_test_examples(
+    item: Any, verify_return_type: bool = True, **run_options
+) -> Optional[ExampleResults]:
     """Verifies the signature of all examples associated with the provided item then
        runs all examples verifying they work as defined.
-       Provided item should be of type function, module, or module name.
+       Provided item should be of type function, module, module name, or list of examples.
 
        - *verify_types*: If `True` all examples will have have their types checked against
          their associated functions type annotations.
+       - *run_options*: Control how the examples are run, such as `workers` or `gather_async`.
+         See `examples.runner.run_tests` for all supported options.
     """
     raise NotImplementedError(f"Currently examples can not be attached to {type(item)}.")
 
 
 @verify_and_test_examples.register(str)
-def _verify_and_test_module_name_examples(item: str, verify_types: bool = True) -> None:
+def _verify_and_test_module_name_examples(
+    item: str, verify_types: bool = True, **run_options
+) -> Optional[ExampleResults]:
     """Verify signatures associated with the provided module name."""
     module_examples = registry.module_registry.get(item, None)
     if not module_examples:
@@ -213,17 +332,23 @@ def _verify_and_test_module_name_examples(item: str, verify_types: bool = True)
             f"Tried verifying example signatures and running tests for {item} module "
             "but no examples are defined for that module."
         )
-    module_examples.verify_and_test_examples(verify_types=verify_types)
+    return module_examples.verify_and_test_examples(verify_types=verify_types, **run_options)
 
 
 @verify_and_test_examples.register(ModuleType)
-def _verify_and_test_module_examples(item: ModuleType, verify_types: bool = True) -> None:
+def _verify_and_test_module_examples(
+    item: ModuleType, verify_types: bool = True, **run_options
+) -> Optional[ExampleResults]:
     """Verify signatures associated with the provided module."""
-    _verify_and_test_module_name_examples(item.__name__, verify_types=verify_types)
+    return _verify_and_test_module_name_examples(
+        item.__name__, verify_types=verify_types, **run_options
+    )
 
 
 @verify_and_test_examples.register(FunctionType)
-def _verify_and_test_function_examples(item: FunctionType, verify_types: bool = True) -> None:
+def _verify_and_test_function_examples(
+    item: FunctionType, verify_types: bool = True, **run_options
+) -> Optional[ExampleResults]:
     """Verify signatures associated with the provided module."""
     examples = get_examples(item)
     if not examples:
@@ -232,8 +357,32 @@ def _verify_and_test_function_examples(item: FunctionType, verify_types: bool =
             " but no examples are defined for that function."
         )
 
-    for function_example in examples:
-        function_example.verify_and_test(verify_types=verify_types)
+    return _run_tests(
+        examples, verify_return_type=verify_types, verify_signatures=True, **run_options
+    )
+
+
+@verify_and_test_examples.register(list)
+def _verify_and_test_selected_examples(
+    item: List[CallableExample], verify_types: bool = True, **run_options
+) -> Optional[ExampleResults]:
+    """Verify signatures of then test the provided examples, such as from `select_examples`."""
+    if not item:
+        raise ValueError(
+            "Tried verifying example signatures and running tests but no examples were provided."
+        )
+
+    return _run_tests(
+        item, verify_return_type=verify_types, verify_signatures=True, **run_options
+    )
+
+
+def render_docs() -> None:
+    """Renders all examples not yet added to their functions doc strings, such as those
+       defined while `examples.configure(lazy_doc_strings=True)` is set.
+    """
+    for module_examples in registry.module_registry.values():
+        module_examples.render_docs()
 
 
 def verify_all_signatures(verify_types: bool = False) -> None:
@@ -242,13 +391,31 @@ def verify_all_signatures(verify_types: bool = False) -> None:
         verify_signatures(module_name, verify_types=verify_types)
 
 
-def test_all_examples(verify_return_type: bool = False) -> None:
-    """Tests all examples against their associated functions."""
-    for module_name in registry.module_registry:
-        test_examples(module_name, verify_return_type=verify_return_type)
+def _all_examples() -> List[CallableExample]:
+    return [
+        example
+        for module_examples in registry.module_registry.values()
+        for example in module_examples.examples
+    ]
 
 
-def verify_and_test_all_examples(verify_types: bool = False) -> None:
-    """Tests all examples while verifying them against their associated functions signatures."""
-    for module_name in registry.module_registry:
-        verify_and_test_examples(module_name, verify_types=verify_types)
+def test_all_examples(verify_return_type: bool = False, **run_options) -> Optional[ExampleResults]:
+    """Tests all examples against their associated functions.
+
+    - *run_options*: Control how the examples are run, such as `workers` or `gather_async`.
+      See `examples.runner.run_tests` for all supported options.
+    """
+    return _run_tests(_all_examples(), verify_return_type=verify_return_type, **run_options)
+
+
+def verify_and_test_all_examples(
+    verify_types: bool = False, **run_options
+) -> Optional[ExampleResults]:
+    """Tests all examples while verifying them against their associated functions signatures.
+
+    - *run_options*: Control how the examples are run, such as `workers` or `gather_async`.
+      See `examples.runner.run_tests` for all supported options.
+    """
+    return _run_tests(
+        _all_examples(), verify_return_type=verify_types, verify_signatures=True, **run_options
+    )
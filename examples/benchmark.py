@@ -0,0 +1,329 @@
+import copy
+import json
+import math
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from examples.api import get_examples
+from examples.example_objects import CallableExample, NotDefined
+from examples.registry import example_id
+
+
+class BenchmarkResult:
+    """The timings of a single example, in seconds per call, across every repeat."""
+
+    __slots__ = ("name", "loops", "timings", "baseline", "threshold")
+
+    def __init__(
+        self,
+        name: str,
+        loops: int,
+        timings: List[float],
+        baseline: Optional[float] = None,
+        threshold: float = 0.1,
+    ):
+        self.name = name
+        self.loops = loops
+        self.timings = sorted(timings)
+        self.baseline = baseline
+        self.threshold = threshold
+
+    @property
+    def min(self) -> float:
+        return self.timings[0]
+
+    @property
+    def median(self) -> float:
+        from statistics import median
+
+        return median(self.timings)
+
+    @property
+    def p99(self) -> float:
+        return self.timings[min(len(self.timings) - 1, int(len(self.timings) * 0.99))]
+
+    @property
+    def change(self) -> Optional[float]:
+        """The relative change of the fastest timing compared to the baseline, if any."""
+        if not self.baseline:
+            return None
+        return self.min / self.baseline - 1
+
+    @property
+    def regressed(self) -> bool:
+        """`True` if the example got slower than the baseline by more than the threshold."""
+        change = self.change
+        return change is not None and change > self.threshold
+
+    def __str__(self):
+        summary = (
+            f"{self.name}: min {_format_seconds(self.min)}, median "
+            f"{_format_seconds(self.median)}, p99 {_format_seconds(self.p99)} "
+            f"({self.loops} loops x {len(self.timings)} repeats)"
+        )
+        if self.change is not None:
+            summary += f", {self.change:+.1%} vs baseline"
+            if self.regressed:
+                summary += " REGRESSED"
+        return summary
+
+    def __repr__(self):
+        return f"BenchmarkResult({self})"
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g}{unit}"
+    return f"{seconds / 1e-9:.3g}ns"
+
+
+def _time_loops(example: CallableExample, loops: int) -> float:
+    use = example.use
+    if example.raises:
+        start = time.perf_counter()
+        for _ in range(loops):
+            try:
+                use()
+            except Exception:  # nosec
+                pass
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(loops):
+        use()
+    return time.perf_counter() - start
+
+
+def _calibrate_loops(example: CallableExample, min_time: float) -> int:
+    """Finds a loop count (1, 2, 5, 10, 20, ...) that takes at least `min_time` seconds."""
+    scale = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            loops = scale * multiplier
+            if _time_loops(example, loops) >= min_time:
+                return loops
+        scale *= 10
+
+
+def benchmark_example(
+    example: CallableExample, warmup: int = 1, repeat: int = 20, min_time: float = 0.01
+) -> BenchmarkResult:
+    """Times calls to `example.use()`, returning how long each call took for every repeat.
+
+    - *warmup*: The number of times the example is called before timing starts.
+    - *repeat*: The number of timings to take.
+    - *min_time*: Each timing calls the example as many times as is needed for it to take
+      at least this many seconds, so that fast examples are timed accurately.
+    """
+    _time_loops(example, warmup)
+    loops = _calibrate_loops(example, min_time)
+    timings = [_time_loops(example, loops) / loops for _ in range(repeat)]
+    return BenchmarkResult(example_id(example), loops, timings)
+
+
+def load_baseline(path: str) -> Dict[str, float]:
+    """Loads the fastest timing of each example from a baseline file, if it exists."""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as baseline_file:
+        return json.load(baseline_file)["examples"]
+
+
+def save_baseline(path: str, results: List[BenchmarkResult]) -> None:
+    """Saves the fastest timing of each example into a baseline file, keeping any existing
+       entries for examples that weren't benchmarked this time.
+    """
+    baseline = load_baseline(path)
+    baseline.update((result.name, result.min) for result in results)
+    with open(path, "w") as baseline_file:
+        json.dump({"version": 1, "examples": baseline}, baseline_file, indent=2, sort_keys=True)
+
+
+def benchmark_examples(
+    item: Any,
+    warmup: int = 1,
+    repeat: int = 20,
+    min_time: float = 0.01,
+    baseline: Optional[str] = None,
+    save: bool = False,
+    threshold: float = 0.1,
+) -> List[BenchmarkResult]:
+    """Benchmarks all examples associated with the provided item, treating each as a
+       representative call of its function.
+       Provided item should be of type function, module, or module name.
+
+       - *warmup*, *repeat*, and *min_time*: Control how each example is timed,
+         see `benchmark_example`.
+       - *baseline*: A JSON file of previous results to compare against. Examples whose fastest
+         timing got slower by more than `threshold` (a fraction, `0.1` being 10%) are flagged
+         as `regressed`.
+       - *save*: If `True` the results are saved into the `baseline` file.
+    """
+    baseline_timings = load_baseline(baseline) if baseline else {}
+    results = []
+    for example in get_examples(item):
+        result = benchmark_example(example, warmup=warmup, repeat=repeat, min_time=min_time)
+        result.baseline = baseline_timings.get(result.name, None)
+        result.threshold = threshold
+        results.append(result)
+
+    if baseline and save:
+        save_baseline(baseline, results)
+    return results
+
+
+def _normal_quantile(probability: float) -> float:
+    """Returns the value the standard normal distribution falls below with the given
+       probability, found by bisecting its cumulative distribution function.
+    """
+    low, high = -10.0, 10.0
+    for _ in range(64):
+        middle = (low + high) / 2
+        if (1 + math.erf(middle / math.sqrt(2))) / 2 < probability:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+
+class ImplementationComparison:
+    """The outcome of running a single example against both an old and a new implementation of
+       a function, along with the timings of each, in seconds per call, for every repeat.
+    """
+
+    __slots__ = ("name", "loops", "old_timings", "new_timings", "difference", "confidence")
+
+    def __init__(
+        self,
+        name: str,
+        loops: int,
+        old_timings: List[float],
+        new_timings: List[float],
+        difference: Optional[str] = None,
+        confidence: float = 0.95,
+    ):
+        self.name = name
+        self.loops = loops
+        self.old_timings = old_timings
+        self.new_timings = new_timings
+        self.difference = difference
+        self.confidence = confidence
+
+    @property
+    def matches(self) -> bool:
+        """`True` if the new implementation returned, or raised, the same as the old one."""
+        return self.difference is None
+
+    def _log_ratios(self) -> List[float]:
+        return [
+            math.log(old / new)
+            for old, new in zip(self.old_timings, self.new_timings)
+            if old > 0 and new > 0
+        ]
+
+    @property
+    def speedup(self) -> float:
+        """How many times faster the new implementation is, as the geometric mean of the
+           ratios between old and new timings taken side by side.
+        """
+        log_ratios = self._log_ratios()
+        return math.exp(sum(log_ratios) / len(log_ratios)) if log_ratios else 1.0
+
+    @property
+    def interval(self) -> Tuple[float, float]:
+        """The confidence interval of `speedup`, using a normal approximation, so it's only
+           meaningful with a reasonable number of repeats.
+        """
+        log_ratios = self._log_ratios()
+        if len(log_ratios) < 2:
+            return self.speedup, self.speedup
+        from statistics import stdev
+
+        center = sum(log_ratios) / len(log_ratios)
+        margin = _normal_quantile((1 + self.confidence) / 2) * stdev(log_ratios)
+        margin /= math.sqrt(len(log_ratios))
+        return math.exp(center - margin), math.exp(center + margin)
+
+    def __str__(self):
+        low, high = self.interval
+        summary = (
+            f"{self.name}: {self.speedup:.3g}x speedup ({self.confidence:.0%} CI "
+            f"{low:.3g}x-{high:.3g}x), old min {_format_seconds(min(self.old_timings))}, "
+            f"new min {_format_seconds(min(self.new_timings))}"
+        )
+        if self.difference is not None:
+            summary += f", MISMATCH: {self.difference}"
+        return summary
+
+    def __repr__(self):
+        return f"ImplementationComparison({self})"
+
+
+def _against(example: CallableExample, new_implementation: Callable) -> CallableExample:
+    """Returns a copy of the example calling the new implementation, expecting whatever the old
+       implementation returned or raised.
+    """
+    new_example = copy.copy(example)
+    new_example.callable_object = new_implementation
+    new_example.raises = None
+    new_example.returns = NotDefined
+    try:
+        result = example.use()
+    except Exception as exception:
+        new_example.raises = exception
+    else:
+        new_example.returns = result
+    return new_example
+
+
+def compare_implementations(
+    old_implementation: Callable,
+    new_implementation: Callable,
+    warmup: int = 1,
+    repeat: int = 20,
+    min_time: float = 0.01,
+    confidence: float = 0.95,
+) -> List[ImplementationComparison]:
+    """Runs every example of `old_implementation` against both it and `new_implementation`,
+       checking the new one returns, or raises, the same as the old one did, using the same
+       rules as `CallableExample.test`, and timing how much faster it is.
+
+       - *warmup*, *repeat*, and *min_time*: Control how each implementation is timed, see
+         `benchmark_example`. Repeats alternate between the two implementations, so that
+         changes in machine load affect both alike.
+       - *confidence*: The confidence level of each speedup's `interval`.
+    """
+    examples = get_examples(old_implementation)
+    if not examples:
+        raise ValueError(
+            f"Tried comparing implementations of {old_implementation} but it has no examples."
+        )
+
+    comparisons = []
+    for example in examples:
+        new_example = _against(example, new_implementation)
+        try:
+            new_example._run_and_check()
+            difference = None
+        except AssertionError as error:
+            difference = str(error)
+        except Exception as exception:
+            difference = f"unexpectedly raised {exception!r}"
+            new_example.raises = exception  # so that timing carries on past it
+
+        _time_loops(example, warmup)
+        _time_loops(new_example, warmup)
+        loops = _calibrate_loops(example, min_time)
+        old_timings = []
+        new_timings = []
+        for _ in range(repeat):
+            old_timings.append(_time_loops(example, loops) / loops)
+            new_timings.append(_time_loops(new_example, loops) / loops)
+        comparisons.append(
+            ImplementationComparison(
+                example_id(example), loops, old_timings, new_timings, difference, confidence
+            )
+        )
+    return comparisons
@@ -0,0 +1,223 @@
+import hashlib
+import json
+import os
+# pickle only dumps values to hash them, it never loads anything
+import pickle  # nosec B403
+import tempfile
+import time
+from types import CodeType, FunctionType, ModuleType
+from typing import Any, Dict, List, Optional, Set
+
+from examples.example_objects import CallableExample, Lazy, NotDefined
+from examples.fixtures import MappedFile
+
+
+def _update_with_code(hasher, code: CodeType) -> None:
+    hasher.update(code.co_code)
+    hasher.update(repr((code.co_names, code.co_varnames, code.co_freevars)).encode())
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            _update_with_code(hasher, constant)
+        else:
+            hasher.update(repr(constant).encode())
+
+
+def _referenced_names(code: CodeType) -> Set[str]:
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            names.update(_referenced_names(constant))
+    return names
+
+
+def _update_with_callable(hasher, function: Any, seen: Set[int]) -> None:
+    hasher.update(getattr(function, "__qualname__", type(function).__qualname__).encode())
+    for name, annotation in (getattr(function, "__annotations__", None) or {}).items():
+        hasher.update(name.encode())
+        _update_with_value(hasher, annotation, seen)
+    signature = getattr(function, "__signature__", None)
+    if signature is not None:
+        hasher.update(str(signature).encode())
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return
+
+    _update_with_code(hasher, code)
+    _update_with_value(hasher, function.__defaults__, seen)
+    _update_with_value(hasher, function.__kwdefaults__, seen)
+    for cell in function.__closure__ or ():
+        try:
+            _update_with_value(hasher, cell.cell_contents, seen)
+        except ValueError:  # pragma: no cover
+            pass  # an empty cell, such as a not yet defined recursive reference
+
+    function_globals = getattr(function, "__globals__", {})
+    names = sorted(_referenced_names(code))
+    for name in names:
+        if name in function_globals:
+            hasher.update(name.encode())
+            value = function_globals[name]
+            if isinstance(value, ModuleType):
+                _update_with_module(hasher, value, names, seen)
+            else:
+                _update_with_value(hasher, value, seen)
+
+
+def _update_with_module(hasher, module: ModuleType, names: List[str], seen: Set[int]) -> None:
+    """Hashes the attributes of a module that share a name the function references, such as
+       `compute` for `helpers.compute(...)`, as attribute names aren't tied to their module.
+    """
+    hasher.update(module.__name__.encode())
+    if id(module) in seen:
+        return
+    seen.add(id(module))
+
+    for name in names:
+        attribute = getattr(module, name, NotDefined)
+        if attribute is NotDefined:
+            continue
+        hasher.update(name.encode())
+        if isinstance(attribute, ModuleType):
+            _update_with_module(hasher, attribute, names, seen)
+        else:
+            _update_with_value(hasher, attribute, seen)
+
+
+def _update_with_value(hasher, value: Any, seen: Set[int]) -> None:
+    if isinstance(value, (FunctionType, type)):
+        if id(value) in seen:
+            hasher.update(b"<seen>")
+            return
+        seen.add(id(value))
+
+    if isinstance(value, FunctionType):
+        _update_with_callable(hasher, value, seen)
+    elif isinstance(value, MappedFile):
+        hasher.update(repr((value.path, str(value.dtype), value.shape)).encode())
+        try:
+            stat = os.stat(value.path)
+            hasher.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        except OSError:
+            hasher.update(b"<missing>")
+    elif isinstance(value, Lazy):
+        hasher.update(b"<lazy>")
+        _update_with_callable(hasher, value.factory, seen)
+    elif isinstance(value, (tuple, list)) and any(isinstance(item, Lazy) for item in value):
+        for item in value:
+            _update_with_value(hasher, item, seen)
+    elif isinstance(value, dict) and any(isinstance(item, Lazy) for item in value.values()):
+        for name, item in value.items():
+            hasher.update(repr(name).encode())
+            _update_with_value(hasher, item, seen)
+    elif isinstance(value, ModuleType):
+        hasher.update(value.__name__.encode())
+    elif isinstance(value, type):
+        hasher.update(f"{value.__module__}.{value.__qualname__}".encode())
+        for attribute_name, attribute in sorted(vars(value).items()):
+            if isinstance(attribute, (FunctionType, classmethod, staticmethod)):
+                hasher.update(attribute_name.encode())
+                _update_with_callable(hasher, getattr(attribute, "__func__", attribute), seen)
+    else:
+        try:
+            hasher.update(pickle.dumps(value, protocol=4))
+        except Exception:
+            hasher.update(repr(value).encode())
+
+
+def fingerprint(example: CallableExample, *salt: Any) -> str:
+    """Returns a stable fingerprint of an example, covering the callables code, closure, and
+       (where feasible) global dependencies, along with the examples arguments and expectations.
+       Anything that can't be pickled is fingerprinted by its repr.
+    """
+    hasher = hashlib.sha256()
+    seen: Set[int] = {id(example.callable_object)}
+    _update_with_callable(hasher, example.callable_object, seen)
+    for value in (
+        example.args,
+        dict(example.kwargs),
+        example.returns,
+        example.raises,
+        example.max_seconds,
+        example.max_memory,
+        example.tolerance,
+        salt,
+    ):
+        hasher.update(b"\0")
+        _update_with_value(hasher, value, seen)
+    return hasher.hexdigest()
+
+
+class ResultCache:
+    """A directory of passing example fingerprints, allowing unchanged examples to be skipped.
+
+    Each result is stored in its own file, written atomically, so any number of processes can
+    safely share the same cache directory.
+
+    - *max_age*: Entries not used in this many seconds are evicted when pruning.
+    - *max_size*: Once the cache holds more than this many bytes, the least recently used
+      entries are evicted when pruning.
+    """
+
+    __slots__ = ("directory", "max_age", "max_size")
+
+    def __init__(
+        self,
+        directory: str,
+        max_age: Optional[float] = 30 * 24 * 60 * 60,
+        max_size: Optional[int] = 64 * 1024 * 1024,
+    ):
+        self.directory = directory
+        self.max_age = max_age
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def passed(self, key: str) -> bool:
+        """Returns `True` if the example with the given fingerprint has previously passed."""
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            return False
+        return True
+
+    def record(self, key: str, example: Optional[CallableExample] = None) -> None:
+        """Records the example with the given fingerprint as passing."""
+        entry: Dict[str, Any] = {"passed": time.time()}
+        if example is not None:
+            function = example.callable_object
+            entry["example"] = f"{function.__module__}.{function.__qualname__}"
+
+        handle, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w") as temporary_file:
+                json.dump(entry, temporary_file)
+            os.replace(temporary_path, self._path(key))
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def prune(self) -> None:
+        """Evicts entries that are older than `max_age` or beyond `max_size`."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.stat().st_size, entry.path))
+                except FileNotFoundError:  # pragma: no cover
+                    pass  # removed by a concurrent prune
+
+        entries.sort(reverse=True)
+        now = time.time()
+        total_size = 0
+        for modified, size, path in entries:
+            total_size += size
+            if (self.max_age is not None and now - modified > self.max_age) or (
+                self.max_size is not None and total_size > self.max_size
+            ):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:  # pragma: no cover
+                    pass
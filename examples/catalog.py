@@ -0,0 +1,236 @@
+import inspect
+import json
+import mmap
+import os
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from examples import registry
+from examples.example_objects import NotDefined, _limited_repr, _tag_set
+
+CATALOG_VERSION = 1
+
+
+class CatalogExample(NamedTuple):
+    """A single example as read back from a `Catalog`, with every value given as its repr."""
+
+    module: str
+    qualname: str
+    position: int
+    rendered: str
+    returns: Optional[str]
+    raises: Optional[str]
+    tags: Tuple[str, ...]
+
+    @property
+    def name(self) -> str:
+        """The same identifier as `registry.example_id`: `module.function[0]`."""
+        return f"{self.module}.{self.qualname}[{self.position}]"
+
+
+def _signature(function: Any) -> str:
+    try:
+        return str(inspect.signature(function))
+    except (TypeError, ValueError):
+        return ""
+
+
+def _fingerprint(function: Any) -> str:
+    import hashlib
+
+    from examples.cache import _update_with_callable
+
+    hasher = hashlib.sha256()
+    _update_with_callable(hasher, function, {id(function)})
+    return hasher.hexdigest()[:16]
+
+
+def _entry(function: Any, examples: List[Any]) -> Dict[str, Any]:
+    return {
+        "signature": _signature(function),
+        "fingerprint": _fingerprint(function),
+        "doc": function.__doc__ or "",
+        "examples": [
+            [
+                str(example),
+                None if example.returns is NotDefined else _limited_repr(example.returns),
+                _limited_repr(example.raises) if example.raises else None,
+                sorted(example.tags),
+            ]
+            for example in examples
+        ],
+    }
+
+
+def export_catalog(path: str, module_names: Optional[Iterable[str]] = None) -> int:
+    """Writes the examples of the given modules, or of every module with examples, into a
+       catalog file that `Catalog` can read back without importing any of those modules.
+       Any examples not yet rendered into doc strings are rendered first.
+       Returns the number of examples exported.
+
+       The catalog starts with a single JSON line indexing where each function's entry is,
+       followed by the entries as compact JSON, so that reading one function's examples only
+       decodes that function's entry. Functions sharing a qualified name, such as those made by
+       a factory, each get their own entry, in the order they were first registered.
+    """
+    import tempfile
+
+    body = bytearray()
+    index: Dict[str, Dict[str, List[Tuple[int, int]]]] = {}
+    exported = 0
+    for module_name in sorted(module_names or registry.module_registry):
+        module_examples = registry.module_registry.get(module_name, None)
+        if module_examples is None:
+            continue
+
+        module_examples.render_docs()
+        module_index = index.setdefault(module_name, {})
+        for function in module_examples.functions:
+            examples = module_examples.get(function)
+            if not examples:
+                continue
+            encoded = json.dumps(_entry(function, examples), separators=(",", ":")).encode()
+            entries = module_index.setdefault(registry._qualname(function), [])
+            entries.append((len(body), len(encoded)))
+            body += encoded + b"\n"
+            exported += len(examples)
+
+    header = json.dumps({"version": CATALOG_VERSION, "modules": index}, separators=(",", ":"))
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile("wb", dir=directory, delete=False) as catalog_file:
+        catalog_file.write(header.encode() + b"\n")
+        catalog_file.write(body)
+    os.replace(catalog_file.name, path)
+    return exported
+
+
+class Catalog:
+    """Serves the examples, and rendered doc strings, of an exported catalog file without
+       importing the modules they came from. The file is memory-mapped where possible, and
+       only the entries of functions queried are ever decoded.
+    """
+
+    __slots__ = ("path", "modules", "_data", "_body")
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as catalog_file:
+            try:
+                self._data: Union[bytes, mmap.mmap] = mmap.mmap(
+                    catalog_file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except (ValueError, OSError):  # such as empty files or unmappable filesystems
+                self._data = catalog_file.read()
+
+        header_end = self._data.find(b"\n")
+        try:
+            header = json.loads(self._data[:header_end])
+        except ValueError:
+            header = None
+        if not isinstance(header, dict) or header.get("version", None) != CATALOG_VERSION:
+            self.close()
+            raise ValueError(
+                f"Tried loading {path} but it isn't a version {CATALOG_VERSION} examples catalog."
+            )
+        self.modules: Dict[str, Dict[str, List[List[int]]]] = header["modules"]
+        self._body = header_end + 1
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __enter__(self) -> "Catalog":
+        return self
+
+    def __exit__(self, *exception_info: Any) -> None:
+        self.close()
+
+    def _read(self, module: str, qualname: str) -> List[Dict[str, Any]]:
+        """Returns the entry of every function exported with the given qualified name."""
+        entries = []
+        for offset, length in self.modules[module][qualname]:
+            start = self._body + offset
+            entries.append(json.loads(self._data[start : start + length]))
+        return entries
+
+    def _locate(self, name: str) -> Tuple[str, Optional[str]]:
+        """Splits a module, or function, name into the module and qualified name it refers to."""
+        if name in self.modules:
+            return name, None
+        module = name
+        while "." in module:
+            module = module.rpartition(".")[0]
+            qualname = name[len(module) + 1 :]
+            if qualname in self.modules.get(module, {}):
+                return module, qualname
+        raise KeyError(f"{name} has no examples within the catalog {self.path}.")
+
+    def functions(self, module: Optional[str] = None) -> List[str]:
+        """Returns the full name of every function with examples, optionally within a module."""
+        module_names = [module] if module else sorted(self.modules)
+        return [
+            f"{module_name}.{qualname}"
+            for module_name in module_names
+            for qualname in self.modules.get(module_name, {})
+        ]
+
+    def _examples(self, module: str, qualname: str) -> List[CatalogExample]:
+        examples = [
+            example for entry in self._read(module, qualname) for example in entry["examples"]
+        ]
+        return [
+            CatalogExample(module, qualname, position, rendered, returns, raises, tuple(tags))
+            for position, (rendered, returns, raises, tags) in enumerate(examples)
+        ]
+
+    def get_examples(self, name: str) -> List[CatalogExample]:
+        """Returns the examples of a function, given as `module.qualname`, or of every function
+           within a module, given as the module name.
+        """
+        module, qualname = self._locate(name)
+        qualnames = [qualname] if qualname else list(self.modules[module])
+        return [
+            example
+            for function_qualname in qualnames
+            for example in self._examples(module, function_qualname)
+        ]
+
+    def select(
+        self, package: str = "", qualname: Optional[str] = None, tags: Iterable[str] = ()
+    ) -> List[CatalogExample]:
+        """Like `examples.select_examples`, returns the examples within a package (or module)
+           of functions with the given `__qualname__`, tagged with every one of the given tags.
+        """
+        required = _tag_set(tags)
+        selected: List[CatalogExample] = []
+        for module in sorted(self.modules):
+            if package and module != package and not module.startswith(f"{package}."):
+                continue
+            for function_qualname in self.modules[module]:
+                if qualname is None or function_qualname == qualname:
+                    selected.extend(
+                        example
+                        for example in self._examples(module, function_qualname)
+                        if required.issubset(example.tags)
+                    )
+        return selected
+
+    def doc_string(self, name: str) -> str:
+        """Returns the doc string of a function, given as `module.qualname`, with its examples
+           rendered into it the same way they would be once imported. If several functions share
+           the qualified name, the first one registered is used.
+        """
+        module, qualname = self._locate(name)
+        if qualname is None:
+            raise KeyError(f"{name} is a module, not a function, within the catalog {self.path}.")
+        return self._read(module, qualname)[0]["doc"]
+
+    def signature(self, name: str) -> Tuple[str, str]:
+        """Returns the signature of a function, given as `module.qualname`, along with a
+           fingerprint of its code at the time it was exported. If several functions share the
+           qualified name, the first one registered is used.
+        """
+        module, qualname = self._locate(name)
+        if qualname is None:
+            raise KeyError(f"{name} is a module, not a function, within the catalog {self.path}.")
+        entry = self._read(module, qualname)[0]
+        return entry["signature"], entry["fingerprint"]
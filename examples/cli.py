@@ -0,0 +1,266 @@
+import argparse
+import importlib
+import importlib.util
+import os
+import sys
+from typing import List, Optional, Sequence
+
+from examples import api, benchmark, catalog, discovery, load, watch
+
+
+def _import_modules(module_names: Sequence[str]) -> None:
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    for module_name in module_names:
+        importlib.import_module(module_name)
+
+
+def _benchmark(arguments: argparse.Namespace) -> int:
+    _import_modules(arguments.modules)
+    regressed = False
+    for module_name in arguments.modules:
+        for result in benchmark.benchmark_examples(
+            module_name,
+            warmup=arguments.warmup,
+            repeat=arguments.repeat,
+            min_time=arguments.min_time,
+            baseline=arguments.baseline,
+            save=arguments.save,
+            threshold=arguments.threshold,
+        ):
+            print(result)
+            regressed = regressed or result.regressed
+    return 1 if regressed else 0
+
+
+def _discover(arguments: argparse.Namespace) -> int:
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    timings = discovery.discover(
+        arguments.package,
+        suffix=arguments.suffix,
+        workers=arguments.workers,
+        cache_file=arguments.cache_file,
+    )
+    for module_name, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+        print(f"{seconds:10.6f}s  {module_name}")
+    print(f"Imported {len(timings)} examples modules in {sum(timings.values()):.6f}s.")
+    return 0
+
+
+def _test(arguments: argparse.Namespace) -> int:
+    _import_modules(arguments.modules)
+    examples = [
+        example for module_name in arguments.modules for example in api.get_examples(module_name)
+    ]
+    if not examples:
+        print("No examples found.")
+        return 1
+
+    fail_fast = not (arguments.keep_going or arguments.junit_xml or arguments.json_lines)
+    try:
+        results = api.verify_and_test_examples(
+            examples,
+            verify_types=not arguments.skip_types,
+            workers=arguments.workers,
+            backend=arguments.backend,
+            cache_dir=arguments.cache_dir,
+            force=arguments.force,
+            shard_index=arguments.shard_index,
+            shard_count=arguments.shard_count,
+            durations=arguments.durations,
+            record_durations=arguments.record_durations,
+            fail_fast=fail_fast,
+            isolate=arguments.isolate,
+            timeout=arguments.timeout,
+        )
+    except Exception as error:
+        print(f"FAILED: {type(error).__name__}: {error}")
+        return 1
+
+    if results is None:
+        return 0
+    if arguments.junit_xml:
+        results.write_junit_xml(arguments.junit_xml)
+    if arguments.json_lines:
+        results.write_json_lines(arguments.json_lines)
+    print(results)
+    return 1 if results.failed else 0
+
+
+def _watch(arguments: argparse.Namespace) -> int:
+    _import_modules(arguments.modules)
+    for module_name in arguments.modules:
+        companion_name = f"{module_name}_examples"
+        if importlib.util.find_spec(companion_name) is not None:
+            importlib.import_module(companion_name)
+
+    try:
+        watch.watch(interval=arguments.interval, verify_types=not arguments.skip_types)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _export(arguments: argparse.Namespace) -> int:
+    _import_modules(arguments.modules)
+    exported = catalog.export_catalog(arguments.output, arguments.modules)
+    if not exported:
+        print("No examples found.")
+        return 1
+    print(f"Exported {exported} examples into {arguments.output}.")
+    return 0
+
+
+def _load(arguments: argparse.Namespace) -> int:
+    _import_modules(arguments.modules)
+    selected = [
+        example
+        for module_name in arguments.modules
+        for example in api.select_examples(
+            package=module_name, qualname=arguments.qualname, tags=arguments.tag
+        )
+    ]
+    if not selected:
+        print("No examples found.")
+        return 1
+
+    results = load.replay_examples(
+        selected,
+        duration=arguments.duration,
+        concurrency=arguments.concurrency,
+        rate=arguments.rate,
+    )
+    for result in results:
+        print(result)
+    calls = sum(result.calls for result in results)
+    print(f"{calls} calls in {arguments.duration}s, {calls / arguments.duration:.1f}/s overall.")
+    return 1 if any(result.errors for result in results) else 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="examples", description="Tests and Documentation Done by Example."
+    )
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    benchmark_command = commands.add_parser(
+        "benchmark", help="Time every example of the given modules, flagging regressions."
+    )
+    benchmark_command.add_argument("modules", nargs="+", help="Modules whose examples to time.")
+    benchmark_command.add_argument("--warmup", type=int, default=1)
+    benchmark_command.add_argument("--repeat", type=int, default=20)
+    benchmark_command.add_argument(
+        "--min-time", type=float, default=0.01, help="Minimum seconds spent per timing."
+    )
+    benchmark_command.add_argument("--baseline", help="A JSON file of results to compare with.")
+    benchmark_command.add_argument(
+        "--save", action="store_true", help="Save the results into the baseline file."
+    )
+    benchmark_command.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="How much slower (as a fraction) an example may get before it's a regression.",
+    )
+    benchmark_command.set_defaults(run=_benchmark)
+
+    discover_command = commands.add_parser(
+        "discover", help="Import every examples module of a package, slowest listed first."
+    )
+    discover_command.add_argument("package", help="The package to discover examples within.")
+    discover_command.add_argument(
+        "--suffix", default="_examples", help="Import modules whose names end with this."
+    )
+    discover_command.add_argument("--workers", type=int, default=1)
+    discover_command.add_argument(
+        "--cache-file", help="A JSON file to remember scanned directories in."
+    )
+    discover_command.set_defaults(run=_discover)
+
+    test_command = commands.add_parser(
+        "test", help="Verify and test every example of the given modules."
+    )
+    test_command.add_argument("modules", nargs="+", help="Modules whose examples to test.")
+    test_command.add_argument(
+        "--skip-types", action="store_true", help="Don't verify types against annotations."
+    )
+    test_command.add_argument("--workers", type=int, default=1)
+    test_command.add_argument("--backend", choices=("thread", "process"), default="thread")
+    test_command.add_argument("--cache-dir", help="A directory to record passing examples in.")
+    test_command.add_argument(
+        "--force", action="store_true", help="Run examples even if they passed previously."
+    )
+    test_command.add_argument(
+        "--shard-index", type=int, default=0, help="Which shard to run, counting from 0."
+    )
+    test_command.add_argument(
+        "--shard-count", type=int, default=1, help="How many shards examples are split into."
+    )
+    test_command.add_argument(
+        "--durations", help="A JSON file of recorded durations to balance shards with."
+    )
+    test_command.add_argument(
+        "--record-durations", help="A JSON file to record the duration of each example into."
+    )
+    test_command.add_argument(
+        "--keep-going", action="store_true", help="Run every example, even after a failure."
+    )
+    test_command.add_argument(
+        "--isolate", action="store_true", help="Run examples within forked worker processes."
+    )
+    test_command.add_argument(
+        "--timeout", type=float, help="Seconds each isolated example is given to complete."
+    )
+    test_command.add_argument("--junit-xml", help="Write a JUnit XML report into this file.")
+    test_command.add_argument("--json-lines", help="Write a JSON Lines report into this file.")
+    test_command.set_defaults(run=_test)
+
+    load_command = commands.add_parser(
+        "load", help="Replay examples as a concurrent workload, reporting latency percentiles."
+    )
+    load_command.add_argument("modules", nargs="+", help="Modules whose examples to replay.")
+    load_command.add_argument(
+        "--duration", type=float, default=10.0, help="Seconds to replay examples for."
+    )
+    load_command.add_argument(
+        "--concurrency", type=int, default=1, help="Threads, and async tasks, making calls."
+    )
+    load_command.add_argument(
+        "--rate", type=float, help="Target calls per second, instead of back to back."
+    )
+    load_command.add_argument("--qualname", help="Only replay examples of this function.")
+    load_command.add_argument(
+        "--tag", action="append", default=[], help="Only replay examples with this tag."
+    )
+    load_command.set_defaults(run=_load)
+
+    export_command = commands.add_parser(
+        "export", help="Write the examples of the given modules into a catalog file."
+    )
+    export_command.add_argument("modules", nargs="+", help="Modules whose examples to export.")
+    export_command.add_argument(
+        "--output", default="examples.catalog", help="The catalog file to write."
+    )
+    export_command.set_defaults(run=_export)
+
+    watch_command = commands.add_parser(
+        "watch", help="Re-run the examples of modules whenever their files change."
+    )
+    watch_command.add_argument(
+        "modules", nargs="+", help="Modules to watch, their _examples modules are included."
+    )
+    watch_command.add_argument(
+        "--interval", type=float, default=0.5, help="Seconds between checking for changes."
+    )
+    watch_command.add_argument(
+        "--skip-types", action="store_true", help="Don't verify types against annotations."
+    )
+    watch_command.set_defaults(run=_watch)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arguments = _parser().parse_args(argv)
+    return arguments.run(arguments)
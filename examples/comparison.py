@@ -0,0 +1,179 @@
+import math
+import sys
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import singledispatch
+from numbers import Number
+from typing import Any, Optional
+
+from examples import example_objects
+
+DIFFERENCES_SHOWN = 5
+
+
+def _describe(value: Any) -> str:
+    return example_objects._limited_repr(value)
+
+
+def _array_module(*values: Any) -> Any:
+    """Returns numpy if it's already imported and any of the values are numpy arrays."""
+    numpy = sys.modules.get("numpy", None)
+    if numpy is not None and any(isinstance(value, numpy.ndarray) for value in values):
+        return numpy
+    return None
+
+
+def _compare_arrays(
+    numpy: Any, expected: Any, actual: Any, tolerance: Optional[float]
+) -> Optional[str]:
+    expected = numpy.asarray(expected)
+    actual = numpy.asarray(actual)
+    if expected.shape != actual.shape:
+        return f"expected an array of shape {expected.shape}, got shape {actual.shape}"
+
+    numeric = expected.dtype.kind in "biufc" and actual.dtype.kind in "biufc"
+    if tolerance is not None and numeric:
+        matches = numpy.isclose(actual, expected, rtol=tolerance, atol=tolerance)
+    else:
+        matches = numpy.asarray(expected == actual)
+        if matches.shape != expected.shape:
+            return f"expected {_describe(expected)}, got {_describe(actual)}"
+    if matches.all():
+        return None
+
+    mismatched = numpy.flatnonzero(~matches)
+    index = numpy.unravel_index(mismatched[0], expected.shape)
+    return (
+        f"{len(mismatched)} of {expected.size} elements differ, the first at index "
+        f"{tuple(int(position) for position in index)}: expected {_describe(expected[index])}, "
+        f"got {_describe(actual[index])}"
+    )
+
+
+def _compare_values(expected: Any, actual: Any, tolerance: Optional[float]) -> Optional[str]:
+    if expected is actual:
+        return None
+
+    numpy = _array_module(expected, actual)
+    if numpy is not None:
+        return _compare_arrays(numpy, expected, actual, tolerance)
+    try:
+        if expected == actual:
+            return None
+    except (TypeError, ValueError) as error:
+        return (
+            f"expected {_describe(expected)}, got {_describe(actual)}, which couldn't be "
+            f"compared ({error}); register a comparator with `examples.comparison.compare`"
+        )
+    return f"expected {_describe(expected)}, got {_describe(actual)}"
+
+
+@singledispatch
+def compare(expected: Any, actual: Any, tolerance: Optional[float] = None) -> Optional[str]:
+    """Compares the value an example returned against the value it was expected to return.
+       Returns `None` if they match, otherwise a short description of the first difference.
+
+       Comparators are looked up by the type of the expected value, and more can be added for
+       your own types with `compare.register`:
+
+            @compare.register(Matrix)
+            def _compare_matrix(expected, actual, tolerance=None):
+                return None if expected.equals(actual) else "the matrices differ"
+
+       - *tolerance*: If given, numbers (including those within containers and numpy arrays)
+         match if they're within this relative, or near zero absolute, tolerance of each other.
+    """
+    return _compare_values(expected, actual, tolerance)
+
+
+@compare.register(Number)
+def _compare_numbers(
+    expected: Any, actual: Any, tolerance: Optional[float] = None
+) -> Optional[str]:
+    if tolerance is None or not isinstance(actual, Number):
+        return _compare_values(expected, actual, tolerance)
+
+    try:
+        if math.isclose(actual, expected, rel_tol=tolerance, abs_tol=tolerance):  # type: ignore
+            return None
+    except TypeError:  # such as complex numbers
+        if abs(actual - expected) <= tolerance * max(1.0, abs(expected)):  # type: ignore
+            return None
+    return f"expected {_describe(expected)} (within {tolerance}), got {_describe(actual)}"
+
+
+@compare.register(str)
+@compare.register(bytes)
+def _compare_strings(
+    expected: Any, actual: Any, tolerance: Optional[float] = None
+) -> Optional[str]:
+    if type(actual) is not type(expected):
+        return _compare_values(expected, actual, tolerance)
+    if expected == actual:
+        return None
+
+    index = next(
+        (index for index, (left, right) in enumerate(zip(expected, actual)) if left != right),
+        min(len(expected), len(actual)),
+    )
+    return (
+        f"expected {_describe(expected[index:index + 40])} at position {index}, "
+        f"got {_describe(actual[index:index + 40])}"
+    )
+
+
+@compare.register(list)
+@compare.register(tuple)
+def _compare_sequences(
+    expected: Any, actual: Any, tolerance: Optional[float] = None
+) -> Optional[str]:
+    if expected is actual:
+        return None
+    if type(actual) is not type(expected):
+        return _compare_values(expected, actual, tolerance)
+    if len(expected) != len(actual):
+        return f"expected {len(expected)} items, got {len(actual)}"
+
+    for index, (expected_item, actual_item) in enumerate(zip(expected, actual)):
+        difference = compare(expected_item, actual_item, tolerance)
+        if difference is not None:
+            return f"[{index}]: {difference}"
+    return None
+
+
+@compare.register(Mapping)
+def _compare_mappings(
+    expected: Any, actual: Any, tolerance: Optional[float] = None
+) -> Optional[str]:
+    if expected is actual:
+        return None
+    if not isinstance(actual, Mapping) or (
+        isinstance(expected, OrderedDict) and isinstance(actual, OrderedDict)
+    ):
+        return _compare_values(expected, actual, tolerance)
+
+    missing = [key for key in expected if key not in actual][:DIFFERENCES_SHOWN]
+    unexpected = [key for key in actual if key not in expected][:DIFFERENCES_SHOWN]
+    if missing or unexpected:
+        return f"missing keys {_describe(missing)}, unexpected keys {_describe(unexpected)}"
+
+    for key, expected_value in expected.items():
+        difference = compare(expected_value, actual[key], tolerance)
+        if difference is not None:
+            return f"[{_describe(key)}]: {difference}"
+    return None
+
+
+@compare.register(set)
+@compare.register(frozenset)
+def _compare_sets(
+    expected: Any, actual: Any, tolerance: Optional[float] = None
+) -> Optional[str]:
+    if expected == actual:
+        return None
+    if not isinstance(actual, (set, frozenset)):
+        return f"expected {_describe(expected)}, got {_describe(actual)}"
+
+    missing = list(expected - actual)[:DIFFERENCES_SHOWN]
+    unexpected = list(actual - expected)[:DIFFERENCES_SHOWN]
+    return f"missing items {_describe(missing)}, unexpected items {_describe(unexpected)}"
@@ -0,0 +1,40 @@
+import os
+from typing import Optional
+
+
+def _environment_flag(name: str, default: bool) -> bool:
+    value = os.environ.get(name, None)
+    if value is None:
+        return default
+    return value.strip().lower() not in ("0", "false", "no", "off", "")
+
+
+enabled: bool = _environment_flag("EXAMPLES_ENABLED", True)
+lazy_doc_strings: bool = _environment_flag("EXAMPLES_LAZY_DOC_STRINGS", False)
+lazy_cache_size: int = 32
+
+
+def configure(
+    enabled: Optional[bool] = None,
+    lazy_doc_strings: Optional[bool] = None,
+    lazy_cache_size: Optional[int] = None,
+) -> None:
+    """Changes how examples behave for the current process.
+
+    - *enabled*: If `False`, the `example` decorator, `add_example_to`, and `Examples.example`
+      return functions untouched, skipping example creation, registration, and doc string
+      rendering entirely. Only examples defined after the change are affected.
+      Can also be turned off before import by setting the `EXAMPLES_ENABLED=0` environment
+      variable, making examples zero-cost for production processes that never run them.
+    - *lazy_doc_strings*: If `True`, examples are no longer rendered into doc strings as they
+      are defined. Instead, they are rendered all at once, and only once, when
+      `examples.render_docs()` is called. Can also be set with `EXAMPLES_LAZY_DOC_STRINGS=1`.
+    - *lazy_cache_size*: The number of resolved `examples.lazy` arguments kept in memory at
+      once, the least recently used being evicted first. Defaults to `32`.
+    """
+    if enabled is not None:
+        globals()["enabled"] = enabled
+    if lazy_doc_strings is not None:
+        globals()["lazy_doc_strings"] = lazy_doc_strings
+    if lazy_cache_size is not None:
+        globals()["lazy_cache_size"] = lazy_cache_size
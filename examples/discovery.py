@@ -0,0 +1,118 @@
+import importlib
+import json
+import os
+import time
+from types import ModuleType
+from typing import Dict, List, Optional, Tuple, Union
+
+_directory_cache: Dict[str, Tuple[int, List[str], List[str]]] = {}
+
+
+def _scan(directory: str) -> Tuple[List[str], List[str]]:
+    """Returns the Python modules and possible subpackages within a directory, only listing
+       the directory again if its modification time changed since it was last scanned.
+    """
+    try:
+        modified = os.stat(directory).st_mtime_ns
+    except OSError:
+        return [], []
+
+    cached = _directory_cache.get(directory, None)
+    if cached is not None and cached[0] == modified:
+        return cached[1], cached[2]
+
+    modules: List[str] = []
+    subdirectories: List[str] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if entry.name.isidentifier() and entry.name != "__pycache__":
+                    subdirectories.append(entry.name)
+            elif entry.name.endswith(".py") and entry.name[:-3].isidentifier():
+                modules.append(entry.name[:-3])
+    modules.sort()
+    subdirectories.sort()
+    _directory_cache[directory] = (modified, modules, subdirectories)
+    return modules, subdirectories
+
+
+def find_companions(
+    package_name: str, locations: List[str], suffix: str = "_examples"
+) -> List[str]:
+    """Returns the names of every module within the package, and its subpackages, whose name
+       ends with `suffix`, without importing any of them.
+    """
+    module_names: List[str] = []
+    pending = [(package_name, location) for location in reversed(locations)]
+    while pending:
+        name, directory = pending.pop()
+        modules, subdirectories = _scan(directory)
+        module_names.extend(f"{name}.{module}" for module in modules if module.endswith(suffix))
+        pending.extend(
+            (f"{name}.{subdirectory}", os.path.join(directory, subdirectory))
+            for subdirectory in reversed(subdirectories)
+        )
+    return module_names
+
+
+def load_cache(path: str) -> None:
+    """Loads previously scanned directories from a JSON file, if it exists."""
+    if not os.path.exists(path):
+        return
+    with open(path) as cache_file:
+        directories = json.load(cache_file)["directories"]
+    for directory, (modified, modules, subdirectories) in directories.items():
+        _directory_cache.setdefault(directory, (modified, modules, subdirectories))
+
+
+def save_cache(path: str) -> None:
+    """Saves every scanned directory into a JSON file, for `load_cache` to speed up later runs."""
+    with open(path, "w") as cache_file:
+        json.dump({"version": 1, "directories": _directory_cache}, cache_file)
+
+
+def _timed_import(module_name: str) -> float:
+    start = time.perf_counter()
+    importlib.import_module(module_name)
+    return time.perf_counter() - start
+
+
+def discover(
+    package: Union[str, ModuleType],
+    suffix: str = "_examples",
+    workers: int = 1,
+    cache_file: Optional[str] = None,
+) -> Dict[str, float]:
+    """Finds and imports every companion examples module (such as `api_examples.py` next to
+       `api.py`) within the package and its subpackages, registering their examples.
+       Returns how many seconds each module took to import, keyed by module name.
+
+       - *suffix*: Modules whose names end with this are imported.
+       - *workers*: If more than `1`, modules are imported across this many threads. The
+         packages containing them are always imported first, one at a time.
+       - *cache_file*: A JSON file to remember the contents of scanned directories in, so
+         that only directories that changed since are listed again.
+    """
+    package_name = package.__name__ if isinstance(package, ModuleType) else package
+    locations = getattr(importlib.import_module(package_name), "__path__", None)
+    if locations is None:
+        raise ValueError(
+            f"Tried discovering examples within {package_name} but it isn't a package."
+        )
+
+    if cache_file:
+        load_cache(cache_file)
+    module_names = find_companions(package_name, list(locations), suffix=suffix)
+    if cache_file:
+        save_cache(cache_file)
+
+    for parent_name in sorted({module_name.rpartition(".")[0] for module_name in module_names}):
+        importlib.import_module(parent_name)
+    if workers > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            timings = list(executor.map(_timed_import, module_names))
+    else:
+        timings = [_timed_import(module_name) for module_name in module_names]
+    return dict(zip(module_names, timings))
@@ -1,9 +1,45 @@
 import asyncio
 import inspect
+import reprlib
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
 from pprint import pformat
-from typing import Any, Callable, get_type_hints
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import ValidationError
+
+from examples import comparison, config, hooks
+from examples.validation import get_validator
+
+_short_repr = reprlib.Repr()
+_short_repr.maxlevel = 4
+_short_repr.maxdict = _short_repr.maxlist = _short_repr.maxtuple = 16
+_short_repr.maxset = _short_repr.maxfrozenset = _short_repr.maxdeque = _short_repr.maxarray = 16
+_short_repr.maxstring = _short_repr.maxlong = _short_repr.maxother = 160
+REPR_LIMIT = 1000
+
+
+def _limited_repr(value: Any, pretty: bool = False) -> str:
+    """Returns the repr of the value, optionally pretty printed, unless it would be longer than
+       `REPR_LIMIT`, in which case an abbreviated repr is returned instead. Values with more
+       items than `REPR_LIMIT` are abbreviated without building their full repr at all.
+    """
+    try:
+        too_large = len(value) > REPR_LIMIT
+    except Exception:
+        too_large = False
+    if not too_large:
+        rendered = pformat(value) if pretty else repr(value)
+        if len(rendered) <= REPR_LIMIT:
+            return rendered
+
+    limited = _short_repr.repr(value)
+    if len(limited) > REPR_LIMIT:
+        return f"{limited[:REPR_LIMIT]}..."
+    return limited
 
 
 class NotDefined:
@@ -14,14 +50,155 @@ class NotDefined:
     pass
 
 
+class Lazy:
+    """An example argument, or return value, that is only created by calling `factory` when
+       the example is used, see `examples.lazy`.
+    """
+
+    __slots__ = ("factory", "cache", "name", "__weakref__")
+
+    def __init__(self, factory: Callable[[], Any], cache: bool = True, name: str = ""):
+        self.factory = factory
+        self.cache = cache
+        self.name = name or getattr(factory, "__qualname__", "") or repr(factory)
+
+    def resolve(self) -> Any:
+        """Returns the value, calling the factory unless the value is already cached."""
+        if not self.cache:
+            return self.factory()
+
+        with _resolved_lock:
+            _evict_resolved()
+            if self in _resolved:
+                _resolved.move_to_end(self)
+                return _resolved[self]
+        value = self.factory()
+        with _resolved_lock:
+            _resolved[self] = value
+            _evict_resolved()
+        return value
+
+    def __repr__(self):
+        return f"{self.name}()"
+
+
+_resolved: "OrderedDict[Lazy, Any]" = OrderedDict()
+_resolved_lock = threading.Lock()
+
+
+def _evict_resolved() -> None:
+    while len(_resolved) > max(config.lazy_cache_size, 0):
+        _resolved.popitem(last=False)
+
+
+def _tag_set(tags: Iterable[str]) -> FrozenSet[str]:
+    """Returns the given tags as a set, taking a single string as one tag rather than as many
+       single character tags.
+    """
+    return frozenset((tags,) if isinstance(tags, str) else tags)
+
+
+def _resolve(value: Any) -> Any:
+    return value.resolve() if isinstance(value, Lazy) else value
+
+
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_started_tracing = False
+
+
+def _start_tracing(frames: int = 1) -> None:
+    """Starts `tracemalloc`, unless it's already tracing, and keeps it tracing until every
+       caller has called `_stop_tracing`, so concurrent measurements don't end each other's.
+    """
+    global _tracing_users, _started_tracing
+    import tracemalloc
+
+    with _tracing_lock:
+        if not _tracing_users and not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            _started_tracing = True
+        _tracing_users += 1
+
+
+def _stop_tracing() -> None:
+    """Stops `tracemalloc` once its last user is done, if `_start_tracing` turned it on."""
+    global _tracing_users, _started_tracing
+    import tracemalloc
+
+    with _tracing_lock:
+        _tracing_users -= 1
+        if not _tracing_users and _started_tracing:
+            _started_tracing = False
+            tracemalloc.stop()
+
+
+class _BudgetMeter:
+    """Measures the wall-clock time, and optionally the peak memory allocated, from creation
+       until `stop` is called. Memory is measured using `tracemalloc`, whose peak is shared by
+       every thread, so memory is only measured accurately while nothing else is running.
+    """
+
+    __slots__ = ("start", "memory_baseline")
+
+    def __init__(self, measure_memory: bool = False):
+        self.memory_baseline: Optional[int] = None
+        if measure_memory:
+            import tracemalloc
+
+            _start_tracing()
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            self.memory_baseline = tracemalloc.get_traced_memory()[0]
+        self.start = time.perf_counter()
+
+    def stop(self) -> Tuple[float, Optional[int]]:
+        """Returns the seconds elapsed and the peak bytes allocated (if measured)."""
+        seconds = time.perf_counter() - self.start
+        if self.memory_baseline is None:
+            return seconds, None
+
+        import tracemalloc
+
+        peak = tracemalloc.get_traced_memory()[1] - self.memory_baseline
+        _stop_tracing()
+        return seconds, peak
+
+
 class CallableExample:
-    """Defines a single Example call against a callable."""
+    """Defines a single Example call against a callable.
 
-    __slots__ = ("args", "kwargs", "callable_object", "returns", "raises")
+       The example's `args` are stored as a tuple and its `kwargs` as a read-only mapping, so
+       that they can only be changed by reassigning them, which discards the example's call plan.
+    """
+
+    __slots__ = (
+        "args",
+        "kwargs",
+        "callable_object",
+        "returns",
+        "raises",
+        "max_seconds",
+        "max_memory",
+        "tags",
+        "tolerance",
+        "_plan",
+        "__weakref__",
+    )
 
     def __init__(
-        self, callable_object: Callable, args, kwargs, returns: Any = NotDefined, raises: Any = None
+        self,
+        callable_object: Callable,
+        args,
+        kwargs,
+        returns: Any = NotDefined,
+        raises: Any = None,
+        max_seconds: Optional[float] = None,
+        max_memory: Optional[int] = None,
+        tags: Iterable[str] = (),
+        tolerance: Optional[float] = None,
     ):
+        self._plan: Optional["_CallPlan"] = None
         self.args = args
         self.kwargs = kwargs
         self.callable_object = callable_object
@@ -29,102 +206,350 @@ class CallableExample:
             raise ValueError("Cannot specify both raises and returns on a single example.")
         self.returns = returns
         self.raises = raises
+        self.max_seconds = max_seconds
+        self.max_memory = max_memory
+        self.tags: FrozenSet[str] = _tag_set(tags)
+        self.tolerance = tolerance
+
+    @property
+    def has_lazy_arguments(self) -> bool:
+        """`True` if any of the example's arguments are `Lazy`, needing to be resolved."""
+        return any(isinstance(arg, Lazy) for arg in self.args) or any(
+            isinstance(value, Lazy) for value in self.kwargs.values()
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "args":
+            value = tuple(value)
+        elif name == "kwargs":
+            value = MappingProxyType(dict(value))
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_plan", None)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name not in ("_plan", "__weakref__") and hasattr(self, name)
+        }
+        state["kwargs"] = dict(state["kwargs"])
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def _call_plan(self) -> "_CallPlan":
+        """Returns the example's call plan, building it if the example is new or any of its
+           attributes were reassigned since it was last built.
+        """
+        plan = self._plan
+        if plan is None:
+            plan = _CallPlan(self)
+            object.__setattr__(self, "_plan", plan)
+        return plan
+
+    def _arguments(self) -> Tuple[Tuple[Any, ...], Mapping[str, Any]]:
+        """Returns the arguments to call with, resolving any `Lazy` arguments."""
+        if not self.has_lazy_arguments:
+            return self.args, self.kwargs
+        return (
+            tuple(_resolve(arg) for arg in self.args),
+            {name: _resolve(value) for name, value in self.kwargs.items()},
+        )
 
     def verify_signature(self, verify_types: bool = True):
         """Verifies that the example makes sense against the functions signature."""
-        bound = inspect.signature(self.callable_object).bind(*self.args, **self.kwargs)
+        validator = get_validator(self.callable_object)
+        bound = validator.bind(self.args, self.kwargs)
 
-        annotations = get_type_hints(self.callable_object)
+        annotations = validator.type_hints
         if verify_types and annotations:
-            test_type_hints = {}
-            typed_example_values = {}
-            for parameter_name, parameter_value in bound.arguments.items():
-                type_hint = annotations.get(parameter_name, None)
-                test_type_hints[parameter_name] = type_hint
-                typed_example_values[parameter_name] = parameter_value
-
+            typed_example_values = {
+                name: _resolve(value) for name, value in bound.arguments.items()
+            }
             if self.returns is not NotDefined and "return" in annotations:
-                test_type_hints["returns"] = annotations["return"]
-                typed_example_values["returns"] = self.returns
+                typed_example_values["returns"] = _resolve(self.returns)
 
-            class ExamplesModel(BaseModel):
-                __annotations__ = test_type_hints
-
-            ExamplesModel(**typed_example_values)
+            validator.validate(typed_example_values)
 
     def use(self) -> Any:
         """Runs the given example, giving back the result returned from running the example call."""
-        if inspect.iscoroutinefunction(self.callable_object):
-            loop = asyncio.get_event_loop()
-            call = self.callable_object(*self.args, **self.kwargs)
-            if loop.is_running():
-                return call  # pragma: no cover
+        if hooks.installed:
+            return hooks.call_with_hooks(self, self._use)
+        return self._use()
 
-            function = asyncio.ensure_future(call, loop=loop)
-            loop.run_until_complete(function)
-            return function.result()
-        return self.callable_object(*self.args, **self.kwargs)
+    def _use(self) -> Any:
+        return self._call_plan().invoke()
 
-    def test(self, verify_return_type: bool = True):
-        """Tests the given example, ensuring the return value matches that specified."""
+    def _check_exception(self, exception: BaseException) -> Any:
+        check = self._call_plan().check_exception
+        if check is None:
+            raise exception
+        check(exception)
+        return NotDefined
+
+    def _check_result(self, result: Any) -> Any:
+        check = self._call_plan().check_result
+        if check is not None:
+            check(result)
+        return result
+
+    def _check_budget(self, seconds: float, memory: Optional[int] = None) -> None:
+        if self.max_seconds is not None and seconds > self.max_seconds:
+            raise AssertionError(
+                f"Example took {seconds:.6f} seconds, exceeding its budget of "
+                f"{self.max_seconds} seconds:\n{self}"
+            )
+        if self.max_memory is not None and memory is not None and memory > self.max_memory:
+            raise AssertionError(
+                f"Example allocated {memory} bytes at its peak, exceeding its budget of "
+                f"{self.max_memory} bytes:\n{self}"
+            )
+
+    def _run_and_check(self) -> Any:
+        """Runs the example, checking the outcome against what the example expects.
+           Returns the result, or `NotDefined` if the example raised as expected.
+        """
+        if self.max_seconds is None and self.max_memory is None:
+            try:
+                result = self.use()
+            except BaseException as exception:
+                return self._check_exception(exception)
+            return self._check_result(result)
+
+        meter = _BudgetMeter(measure_memory=self.max_memory is not None)
         try:
             result = self.use()
         except BaseException as exception:
-            if not self.raises:
-                raise
-
-            if (type(self.raises) == type and not isinstance(exception, self.raises)) or (
-                type(self.raises) != type
-                and (
-                    not isinstance(exception, type(self.raises))
-                    or self.raises.args != exception.args
-                )
-            ):
-                raise AssertionError(
-                    f"Example expected {repr(self.raises)} to be raised but "
-                    f"instead {repr(exception)} was raised"
-                )
-            return
+            self._check_budget(*meter.stop())
+            return self._check_exception(exception)
+        self._check_budget(*meter.stop())
+        return self._check_result(result)
 
-        if self.raises:
-            raise AssertionError(
-                f"Example expected {repr(self.raises)} to be raised "
-                f"but instead {repr(result)} was returned"
+    async def _run_and_check_async(self, timeout: Optional[float] = None) -> Any:
+        """Awaits the coroutine example on the running event loop, checking the outcome the
+           same way as `_run_and_check`. Fails if the example takes longer than `timeout`.
+           Memory budgets can't be attributed to a single concurrently running example,
+           so only `max_seconds` is enforced.
+        """
+        active_hooks = tuple(hooks.installed)
+        for hook in active_hooks:
+            hook.before(self)
+        start = time.perf_counter()
+        args, kwargs = self._arguments()
+        call = asyncio.ensure_future(self.callable_object(*args, **kwargs))
+        done, _ = await asyncio.wait({call}, timeout=timeout)
+        seconds = time.perf_counter() - start
+        if not done:
+            call.cancel()
+            timed_out = AssertionError(
+                f"Example didn't complete within its timeout of {timeout} seconds:\n{self}"
             )
-        elif self.returns is not NotDefined:
-            if result != self.returns:
-                raise AssertionError(
-                    f"Example's expected return value of '{self.returns}' "
-                    f"does not not match actual return value of `{result}`"
-                )
+            for hook in reversed(active_hooks):
+                hook.after(self, seconds, timed_out)
+            raise timed_out
 
-        if verify_return_type:
-            type_hints = get_type_hints(self.callable_object)
-            if type_hints and "return" in type_hints:
+        for hook in reversed(active_hooks):
+            hook.after(self, seconds, call.exception())
+        if self.max_seconds is not None:
+            self._check_budget(seconds)
 
-                class ExampleReturnsModel(BaseModel):
-                    __annotations__ = {"returns": type_hints["return"]}
+        try:
+            result = call.result()
+        except BaseException as exception:
+            return self._check_exception(exception)
+        return self._check_result(result)
 
-                ExampleReturnsModel(returns=result)
+    def test(self, verify_return_type: bool = True):
+        """Tests the given example, ensuring the return value matches that specified."""
+        result = self._run_and_check()
+        if verify_return_type and result is not NotDefined:
+            validator = get_validator(self.callable_object)
+            if "return" in validator.type_hints:
+                validator.validate({"returns": result})
 
     def verify_and_test(self, verify_types: bool = True) -> None:
         self.verify_signature(verify_types=verify_types)
         self.test(verify_return_type=verify_types)
 
     def __str__(self):
-        arg_str = ",\n    ".join(repr(arg) for arg in self.args)
+        arg_str = ",\n    ".join(_limited_repr(arg) for arg in self.args)
         if self.kwargs:
             arg_str += ",\n    " if arg_str else ""
             arg_str += ",\n    ".join(
-                f"{name}={repr(value)}" for name, value in self.kwargs.items()
+                f"{name}={_limited_repr(value)}" for name, value in self.kwargs.items()
             )
 
         call_str = f"{self.callable_object.__name__}(\n    {arg_str}\n)"
         if self.returns is not NotDefined:
-            call_str += f"\n == \n{pformat(self.returns)}"
+            call_str += f"\n == \n{_limited_repr(self.returns, pretty=True)}"
         elif self.raises:
-            call_str += f"\nraises {pformat(self.raises)}"
+            call_str += f"\nraises {_limited_repr(self.raises, pretty=True)}"
         return call_str
 
     def __repr__(self):
         return f"Example:\n{str(self)}"
+
+
+_EXACTLY_COMPARED = frozenset(
+    (int, float, complex, bool, str, bytes, list, tuple, dict, set, frozenset)
+)
+
+
+def _run_coroutine(call: Callable[[], Any]) -> Any:
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:  # no event loop set for this thread, such as a pool worker
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    coroutine = call()
+    if loop.is_running():
+        return coroutine  # pragma: no cover
+
+    function = asyncio.ensure_future(coroutine, loop=loop)
+    loop.run_until_complete(function)
+    return function.result()
+
+
+def _invoker(example: CallableExample) -> Callable[[], Any]:
+    function = example.callable_object
+    if example.has_lazy_arguments:
+        arguments = example._arguments
+
+        def call() -> Any:
+            args, kwargs = arguments()
+            return function(*args, **kwargs)
+
+    elif example.args or example.kwargs:
+        call = partial(function, *example.args, **example.kwargs)
+    else:
+        call = function
+
+    if inspect.iscoroutinefunction(function):
+        return partial(_run_coroutine, call)
+    return call
+
+
+def _result_checker(example: CallableExample) -> Optional[Callable[[Any], None]]:
+    raises = example.raises
+    if raises:
+
+        def check_unexpected_return(result: Any) -> None:
+            raise AssertionError(
+                f"Example expected {repr(raises)} to be raised "
+                f"but instead {repr(result)} was returned"
+            )
+
+        return check_unexpected_return
+
+    returns = example.returns
+    if returns is NotDefined:
+        return None
+
+    compare = comparison.compare
+    tolerance = example.tolerance
+    lazy = isinstance(returns, Lazy)
+    exact_type = (
+        type(returns) if tolerance is None and type(returns) in _EXACTLY_COMPARED else None
+    )
+
+    def check_returned(result: Any) -> None:
+        expected = returns.resolve() if lazy else returns
+        if result is expected:
+            return
+        if type(result) is exact_type:
+            try:
+                if result == expected:
+                    return
+            except (TypeError, ValueError):  # such as containers of numpy arrays
+                pass
+
+        difference = compare(expected, result, tolerance)
+        if difference is not None:
+            raise AssertionError(
+                f"Example's expected return value of '{_limited_repr(expected)}' "
+                f"does not not match actual return value of `{_limited_repr(result)}`: "
+                f"{difference}"
+            )
+
+    return check_returned
+
+
+def _exception_checker(example: CallableExample) -> Optional[Callable[[BaseException], None]]:
+    raises = example.raises
+    if not raises:
+        return None
+
+    if type(raises) == type:
+        expected_type, expected_args = raises, None
+    else:
+        expected_type, expected_args = type(raises), raises.args
+
+    def check_raised(exception: BaseException) -> None:
+        if isinstance(exception, expected_type) and (
+            expected_args is None or exception.args == expected_args
+        ):
+            return
+
+        raise AssertionError(
+            f"Example expected {repr(raises)} to be raised but "
+            f"instead {repr(exception)} was raised"
+        )
+
+    return check_raised
+
+
+class _CallPlan:
+    """An example's call and the checks of its outcome, specialized once for what the example
+       expects so that each run skips re-inspecting the callable, arguments, and expectations.
+       Reassigning any attribute of the example discards its plan.
+    """
+
+    __slots__ = ("invoke", "check_result", "check_exception")
+
+    def __init__(self, example: CallableExample):
+        self.invoke = _invoker(example)
+        self.check_result = _result_checker(example)
+        self.check_exception = _exception_checker(example)
+
+
+def test_examples_by_callable(
+    examples: Iterable[CallableExample], verify_return_type: bool = True
+) -> None:
+    """Tests the given examples grouped by their callable, validating the return types of each
+       group in a single batch so validation cost scales with functions rather than examples.
+    """
+    grouped_examples: Dict[Callable, List[CallableExample]] = {}
+    for example in examples:
+        grouped_examples.setdefault(example.callable_object, []).append(example)
+
+    for callable_examples in grouped_examples.values():
+        results = [example._run_and_check() for example in callable_examples]
+        if verify_return_type:
+            validate_returns_by_callable(callable_examples, results)
+
+
+def validate_returns_by_callable(examples: List[CallableExample], results: List[Any]) -> None:
+    """Validates the results of already run examples against their callables return type hints,
+       with a single batched validation per callable. `NotDefined` results are skipped.
+    """
+    grouped_results: Dict[Callable, Tuple[List[CallableExample], List[Any]]] = {}
+    for example, result in zip(examples, results):
+        if result is not NotDefined:
+            returned_examples, returned_results = grouped_results.setdefault(
+                example.callable_object, ([], [])
+            )
+            returned_examples.append(example)
+            returned_results.append(result)
+
+    for callable_object, (returned_examples, returned_results) in grouped_results.items():
+        try:
+            get_validator(callable_object).validate_returns(returned_results)
+        except ValidationError as error:
+            failed_index = int(error.errors()[0]["loc"][1])
+            raise AssertionError(
+                f"Example's return value of `{returned_results[failed_index]}` does not match "
+                f"the return type annotation of {callable_object.__name__}:\n"
+                f"{repr(returned_examples[failed_index])}\n{error}"
+            ) from error
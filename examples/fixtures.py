@@ -0,0 +1,74 @@
+import mmap
+import os
+from typing import Any, Optional, Tuple, Union
+
+from examples.example_objects import Lazy
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as error:  # pragma: no cover
+        raise ImportError("Memory-mapping arrays for examples requires numpy.") from error
+    return numpy
+
+
+class MappedFile(Lazy):
+    """A `Lazy` example value that memory-maps a file when the example is used, see `mapped`.
+
+       When pickled, such as to be sent to a process pool worker, only the reference to the
+       file is sent, and each worker maps the same file, sharing its pages.
+    """
+
+    __slots__ = ("path", "dtype", "shape")
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        dtype: Any = None,
+        shape: Optional[Tuple[int, ...]] = None,
+        cache: bool = True,
+    ):
+        self.path = os.fspath(path)
+        self.dtype = dtype
+        self.shape = shape
+        super().__init__(self._map, cache=cache, name=f"mapped({self.path!r})")
+
+    def _map(self) -> Any:
+        if self.path.endswith(".npy"):
+            return _numpy().load(self.path, mmap_mode="r")
+        elif self.dtype is not None:
+            return _numpy().memmap(self.path, dtype=self.dtype, mode="r", shape=self.shape)
+
+        with open(self.path, "rb") as mapped_file:
+            if os.fstat(mapped_file.fileno()).st_size == 0:
+                return memoryview(b"")
+            return memoryview(mmap.mmap(mapped_file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __reduce__(self):
+        return (MappedFile, (self.path, self.dtype, self.shape, self.cache))
+
+    def __repr__(self):
+        return self.name
+
+
+def mapped(
+    path: Union[str, "os.PathLike[str]"],
+    dtype: Any = None,
+    shape: Optional[Tuple[int, ...]] = None,
+    cache: bool = True,
+) -> MappedFile:
+    """References a file as an example argument or return value, memory-mapping it read-only
+       only once the example is used, so its contents are never copied into memory up front:
+
+            @example(mapped(DATA / "matrix.npy"), _example_returns=mapped(DATA / "total.npy"))
+            def total(matrix: numpy.ndarray) -> numpy.ndarray:
+
+       Rendered examples show the file reference, never the contents.
+
+       - *path*: A `.npy` file, loaded as a memory-mapped numpy array, or any other file.
+       - *dtype* and *shape*: If a `dtype` is given, other files are mapped as a numpy array of
+         that type and shape. Otherwise a read-only `memoryview` of the raw bytes is given.
+       - *cache*: If `True` the mapping is kept open for reuse, as with `examples.lazy`.
+    """
+    return MappedFile(path, dtype=dtype, shape=shape, cache=cache)
@@ -0,0 +1,61 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional
+
+installed: List["ExampleHook"] = []
+
+
+class ExampleHook:
+    """The base for hooks that get called around every call of an example, such as those made
+       by `CallableExample.use` and `CallableExample.test`. Subclass and override either method.
+    """
+
+    def before(self, example: Any) -> None:
+        """Called right before the example's callable is called."""
+
+    def after(self, example: Any, seconds: float, exception: Optional[BaseException]) -> None:
+        """Called right after the example's callable returns or raises, with the number of
+           seconds the call took and the exception it raised (if any).
+        """
+
+
+def add_hook(hook: ExampleHook) -> None:
+    """Installs a hook to be called around every example call, until removed."""
+    installed.append(hook)
+
+
+def remove_hook(hook: ExampleHook) -> None:
+    """Removes a previously installed hook."""
+    installed.remove(hook)
+
+
+@contextmanager
+def using_hooks(*hooks: ExampleHook) -> Iterator[None]:
+    """Installs the given hooks only for the duration of the `with` block."""
+    for hook in hooks:
+        add_hook(hook)
+    try:
+        yield
+    finally:
+        for hook in hooks:
+            remove_hook(hook)
+
+
+def call_with_hooks(example: Any, call: Callable[[], Any]) -> Any:
+    """Calls `call` surrounded by every installed hook. Hooks are called in the order they
+       were installed before the call, and in reverse order after it.
+    """
+    hooks = tuple(installed)
+    for hook in hooks:
+        hook.before(example)
+    exception: Optional[BaseException] = None
+    start = time.perf_counter()
+    try:
+        return call()
+    except BaseException as raised:
+        exception = raised
+        raise
+    finally:
+        seconds = time.perf_counter() - start
+        for hook in reversed(hooks):
+            hook.after(example, seconds, exception)
@@ -0,0 +1,174 @@
+import multiprocessing
+import os
+import signal
+import time
+from collections import deque
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from examples import hooks, registry
+from examples.example_objects import CallableExample
+from examples.results import Error
+
+Outcome = Tuple[float, Optional[Error]]
+
+
+def _fork_context() -> Any:
+    if "fork" not in multiprocessing.get_all_start_methods():
+        raise ValueError(
+            "Tried isolating examples but worker processes can only be forked on this platform."
+        )
+    return multiprocessing.get_context("fork")
+
+
+def _serve(
+    examples: List[CallableExample],
+    action: Callable[[CallableExample], Outcome],
+    connection: Connection,
+) -> None:
+    """Runs examples, by their index, as the parent sends them until told to stop."""
+    hooks.installed.clear()
+    while True:
+        try:
+            index = connection.recv()
+        except EOFError:
+            return
+        if index is None:
+            return
+        connection.send((index, action(examples[index])))
+
+
+class _Worker:
+    """A forked worker process along with the example, if any, it's currently running."""
+
+    __slots__ = ("process", "connection", "index", "started")
+
+    def __init__(
+        self,
+        context: Any,
+        examples: List[CallableExample],
+        action: Callable[[CallableExample], Outcome],
+    ):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(
+            target=_serve, args=(examples, action, child_connection), daemon=True
+        )
+        self.process.start()
+        child_connection.close()
+        self.index: Optional[int] = None
+        self.started = 0.0
+
+    def assign(self, index: int) -> None:
+        self.index = index
+        self.started = time.perf_counter()
+        self.connection.send(index)
+
+    def receive(self) -> Optional[Tuple[int, Outcome]]:
+        """Returns the outcome the worker sent, or `None` if the worker died instead."""
+        try:
+            return self.connection.recv()
+        except (EOFError, OSError):
+            return None
+
+    def kill(self) -> None:
+        if self.process.exitcode is None:
+            os.kill(self.process.pid, signal.SIGKILL)
+        self.process.join()
+        self.connection.close()
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except OSError:  # pragma: no cover
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():  # pragma: no cover
+            self.kill()
+        self.connection.close()
+
+
+def run_isolated(
+    examples: List[CallableExample],
+    action: Callable[[CallableExample], Outcome],
+    workers: int = 1,
+    timeout: Optional[float] = None,
+) -> List[Outcome]:
+    """Runs the given action against every example within a pool of forked worker processes,
+       returning the `(seconds, error)` outcome of each, in the order given.
+
+       Workers are forked once, inheriting every example, and then run one example after
+       another, so only the index of each example is sent to them. A worker that crashes, such
+       as from a segfault within native code, or that takes longer than `timeout` seconds on an
+       example is killed and replaced, and that example fails naming what happened to it.
+
+    - *workers*: The number of worker processes to run examples across.
+    - *timeout*: The number of seconds each example is given to complete.
+    """
+    context = _fork_context()
+    outcomes: Dict[int, Outcome] = {}
+    pending: Deque[int] = deque(range(len(examples)))
+    pool = [_Worker(context, examples, action) for _ in range(min(workers, len(examples)))]
+
+    def replace(worker_index: int, seconds: float, error: Error) -> None:
+        worker = pool[worker_index]
+        outcomes[worker.index] = (seconds, error)  # type: ignore
+        worker.kill()
+        pool[worker_index] = _Worker(context, examples, action)
+
+    try:
+        while len(outcomes) < len(examples):
+            for worker in pool:
+                if worker.index is None and pending:
+                    worker.assign(pending.popleft())
+
+            busy = [worker for worker in pool if worker.index is not None]
+            wait_for = None
+            if timeout is not None:
+                now = time.perf_counter()
+                wait_for = max(min(worker.started + timeout for worker in busy) - now, 0)
+            ready = wait(
+                [worker.connection for worker in busy]
+                + [worker.process.sentinel for worker in busy],
+                timeout=wait_for,
+            )
+
+            now = time.perf_counter()
+            for worker_index, worker in enumerate(pool):
+                if worker.index is None:
+                    continue
+                if worker.connection in ready or worker.process.sentinel in ready:
+                    received = worker.receive()
+                    if received is not None:
+                        outcomes[received[0]] = received[1]
+                        worker.index = None
+                        continue
+
+                    worker.process.join()
+                    name = registry.example_id(examples[worker.index])
+                    replace(
+                        worker_index,
+                        now - worker.started,
+                        (
+                            "WorkerCrashed",
+                            f"The worker running example {name} exited with code "
+                            f"{worker.process.exitcode}.",
+                        ),
+                    )
+                elif timeout is not None and now - worker.started >= timeout:
+                    name = registry.example_id(examples[worker.index])
+                    replace(
+                        worker_index,
+                        now - worker.started,
+                        (
+                            "TimeoutError",
+                            f"Example {name} didn't complete within its timeout of {timeout} "
+                            "seconds, so its worker was killed.",
+                        ),
+                    )
+    finally:
+        for worker in pool:
+            if worker.index is None:
+                worker.stop()
+            else:
+                worker.kill()
+    return [outcomes[index] for index in range(len(examples))]
@@ -0,0 +1,218 @@
+import asyncio
+import inspect
+import threading
+import time
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from examples.api import get_examples
+from examples.benchmark import _format_seconds
+from examples.example_objects import CallableExample
+from examples.registry import _qualname
+
+
+class LoadResult:
+    """The latency, in seconds, of every call made to a single function while replaying
+       its examples as a workload.
+    """
+
+    __slots__ = ("name", "latencies", "errors", "seconds")
+
+    def __init__(self, name: str, latencies: "array[float]", errors: int, seconds: float):
+        self.name = name
+        self.latencies = array("d", sorted(latencies))
+        self.errors = errors
+        self.seconds = seconds
+
+    @property
+    def calls(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        """Calls completed per second."""
+        return self.calls / self.seconds if self.seconds else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        if not self.latencies:
+            return 0.0
+        return self.latencies[min(len(self.latencies) - 1, int(len(self.latencies) * fraction))]
+
+    @property
+    def p50(self) -> float:
+        return self.percentile(0.5)
+
+    @property
+    def p95(self) -> float:
+        return self.percentile(0.95)
+
+    @property
+    def p99(self) -> float:
+        return self.percentile(0.99)
+
+    def __str__(self):
+        return (
+            f"{self.name}: {self.calls} calls, {self.throughput:.1f}/s, p50 "
+            f"{_format_seconds(self.p50)}, p95 {_format_seconds(self.p95)}, p99 "
+            f"{_format_seconds(self.p99)}, {self.errors} errors"
+        )
+
+    def __repr__(self):
+        return f"LoadResult({self})"
+
+
+class _Schedule:
+    """Hands out examples round-robin until the deadline, spaced out to the target rate
+       (calls per second) if one is set, otherwise as fast as they're claimed.
+    """
+
+    __slots__ = ("examples", "rate", "start", "deadline", "_claimed", "_lock")
+
+    def __init__(self, examples: List[CallableExample], rate: Optional[float], duration: float):
+        self.examples = examples
+        self.rate = rate
+        self.start = time.perf_counter()
+        self.deadline = self.start + duration
+        self._claimed = 0
+        self._lock = threading.Lock()
+
+    def claim(self) -> Optional[Tuple[CallableExample, float]]:
+        """Returns the next example to call along with when to call it, or `None` once done."""
+        with self._lock:
+            index = self._claimed
+            self._claimed += 1
+        due = self.start + index / self.rate if self.rate else time.perf_counter()
+        if due >= self.deadline:
+            return None
+        return self.examples[index % len(self.examples)], due
+
+
+class _Recorded:
+    """The latencies and errors of calls made by a single worker, keyed by function name."""
+
+    __slots__ = ("latencies", "errors")
+
+    def __init__(self):
+        self.latencies: Dict[str, "array[float]"] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record(self, example: CallableExample, seconds: float, error: bool) -> None:
+        function = example.callable_object
+        name = f"{getattr(function, '__module__', '')}.{_qualname(function)}"
+        latencies = self.latencies.get(name, None)
+        if latencies is None:
+            latencies = self.latencies[name] = array("d")
+            self.errors[name] = 0
+        latencies.append(seconds)
+        if error:
+            self.errors[name] += 1
+
+
+def _replay_sync(schedule: _Schedule) -> _Recorded:
+    recorded = _Recorded()
+    while True:
+        claimed = schedule.claim()
+        if claimed is None:
+            return recorded
+
+        example, due = claimed
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        start = time.perf_counter()
+        try:
+            example.use()
+            error = False
+        except Exception:
+            error = not example.raises
+        recorded.record(example, time.perf_counter() - start, error)
+
+
+async def _replay_async_worker(schedule: _Schedule) -> _Recorded:
+    recorded = _Recorded()
+    while True:
+        claimed = schedule.claim()
+        if claimed is None:
+            return recorded
+
+        example, due = claimed
+        delay = due - time.perf_counter()
+        await asyncio.sleep(max(delay, 0))
+        args, kwargs = example._arguments()
+        start = time.perf_counter()
+        try:
+            await example.callable_object(*args, **kwargs)
+            error = False
+        except Exception:
+            error = not example.raises
+        recorded.record(example, time.perf_counter() - start, error)
+
+
+def _replay_async(schedule: _Schedule, concurrency: int) -> List[_Recorded]:
+    async def replay() -> List[_Recorded]:
+        return await asyncio.gather(
+            *(_replay_async_worker(schedule) for _ in range(concurrency))
+        )
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(replay())
+    finally:
+        loop.close()
+
+
+def replay_examples(
+    item: Any, duration: float = 10.0, concurrency: int = 1, rate: Optional[float] = None
+) -> List[LoadResult]:
+    """Replays the examples associated with the provided item as a workload for `duration`
+       seconds, returning the throughput and latency percentiles of each function.
+       Provided item should be of type function, module, module name, or list of examples.
+
+       Examples are called round-robin, across `concurrency` threads for regular functions
+       and `concurrency` tasks on an event loop for coroutine functions. Exceptions raised
+       by examples not expecting them are counted as errors; results aren't checked.
+
+       - *rate*: A target number of calls per second, split between regular and coroutine
+         functions by their share of the examples. If not set, calls are made back to back.
+    """
+    examples = item if isinstance(item, list) else get_examples(item)
+    if not examples:
+        raise ValueError("Tried replaying examples but no examples were provided.")
+
+    asynchronous: List[CallableExample] = []
+    synchronous: List[CallableExample] = []
+    for example in examples:
+        if inspect.iscoroutinefunction(example.callable_object):
+            asynchronous.append(example)
+        else:
+            synchronous.append(example)
+
+    def share(selected: List[CallableExample]) -> Optional[float]:
+        return rate * len(selected) / len(examples) if rate else None
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    start = time.perf_counter()
+    recorded: List[_Recorded] = []
+    with ThreadPoolExecutor(max_workers=concurrency + 1) as executor:
+        async_replay = None
+        if asynchronous:
+            schedule = _Schedule(asynchronous, share(asynchronous), duration)
+            async_replay = executor.submit(_replay_async, schedule, concurrency)
+        if synchronous:
+            schedule = _Schedule(synchronous, share(synchronous), duration)
+            sync_replays = [executor.submit(_replay_sync, schedule) for _ in range(concurrency)]
+            recorded.extend(replay.result() for replay in sync_replays)
+        if async_replay is not None:
+            recorded.extend(async_replay.result())
+    seconds = time.perf_counter() - start
+
+    merged = _Recorded()
+    for worker_recorded in recorded:
+        for name, latencies in worker_recorded.latencies.items():
+            merged.latencies.setdefault(name, array("d")).extend(latencies)
+            merged.errors[name] = merged.errors.get(name, 0) + worker_recorded.errors[name]
+    return [
+        LoadResult(name, latencies, merged.errors[name], seconds)
+        for name, latencies in sorted(merged.latencies.items())
+    ]
@@ -0,0 +1,122 @@
+import cProfile
+import io
+import os
+import pstats
+import re
+import threading
+import tracemalloc
+from typing import Any, Dict, Optional
+
+from examples.example_objects import _start_tracing, _stop_tracing
+from examples.hooks import ExampleHook
+from examples.registry import example_id
+
+_UNSAFE_FILE_CHARACTERS = re.compile(r"[^A-Za-z0-9_.()\[\]-]+")
+
+
+def _file_name(example: Any, extension: str) -> str:
+    return _UNSAFE_FILE_CHARACTERS.sub("_", example_id(example)) + extension
+
+
+class ProfileHook(ExampleHook):
+    """Profiles every example call with `cProfile`, writing a `.prof` file per example into
+       `directory` (loadable with `pstats` or tools such as snakeviz) and accumulating the
+       results of all calls for `summary`.
+
+       Only one example is profiled at a time per thread: examples called while another
+       example is being profiled are included in the outer examples profile.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.stats: Optional[pstats.Stats] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        os.makedirs(directory, exist_ok=True)
+
+    def before(self, example: Any) -> None:
+        if getattr(self._local, "profiling", None) is not None:
+            return
+
+        profiler = cProfile.Profile()
+        self._local.profiling = (example, profiler)
+        profiler.enable()
+
+    def after(self, example: Any, seconds: float, exception: Optional[BaseException]) -> None:
+        profiling = getattr(self._local, "profiling", None)
+        if profiling is None or profiling[0] is not example:
+            return
+
+        profiler = profiling[1]
+        profiler.disable()
+        self._local.profiling = None
+        profiler.dump_stats(os.path.join(self.directory, _file_name(example, ".prof")))
+        with self._lock:
+            if self.stats is None:
+                self.stats = pstats.Stats(profiler)
+            else:
+                self.stats.add(profiler)
+
+    def summary(self, top: int = 20, sort_by: str = "cumulative") -> str:
+        """Returns a report of the `top` hottest functions across every profiled example."""
+        if self.stats is None:
+            return "No examples were profiled."
+
+        output = io.StringIO()
+        with self._lock:
+            self.stats.stream = output  # type: ignore
+            self.stats.sort_stats(sort_by).print_stats(top)
+        return output.getvalue()
+
+
+class AllocationHook(ExampleHook):
+    """Traces memory allocations of every example call with `tracemalloc`, writing a snapshot
+       of the allocations that are still alive once the call returns to a `.snapshot` file per
+       example into `directory` (loadable with `tracemalloc.Snapshot.load`). The growth in
+       memory of each call is accumulated per source line for `summary`.
+
+       If `tracemalloc` isn't already tracing, it's only turned on while examples are running,
+       and stays on until the last example running on any thread is done.
+    """
+
+    def __init__(self, directory: str, frames: int = 1):
+        self.directory = directory
+        self.frames = frames
+        self.growth: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        os.makedirs(directory, exist_ok=True)
+
+    def before(self, example: Any) -> None:
+        if getattr(self._local, "tracing", None) is not None:
+            return
+
+        _start_tracing(self.frames)
+        self._local.tracing = (example, tracemalloc.take_snapshot())
+
+    def after(self, example: Any, seconds: float, exception: Optional[BaseException]) -> None:
+        tracing = getattr(self._local, "tracing", None)
+        if tracing is None or tracing[0] is not example:
+            return
+
+        _, before = tracing
+        self._local.tracing = None
+        try:
+            after = tracemalloc.take_snapshot()
+        finally:
+            _stop_tracing()
+        after.dump(os.path.join(self.directory, _file_name(example, ".snapshot")))
+        with self._lock:
+            for difference in after.compare_to(before, "lineno"):
+                if difference.size_diff > 0:
+                    location = str(difference.traceback)
+                    self.growth[location] = self.growth.get(location, 0) + difference.size_diff
+
+    def summary(self, top: int = 20) -> str:
+        """Returns a report of the `top` source lines that memory grew the most from."""
+        if not self.growth:
+            return "No example allocations were traced."
+
+        with self._lock:
+            largest = sorted(self.growth.items(), key=lambda item: item[1], reverse=True)[:top]
+        return "\n".join(f"{size:>12} B  {location}" for location, size in largest)
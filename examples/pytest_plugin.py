@@ -0,0 +1,102 @@
+import importlib
+import inspect
+import sys
+from typing import Any, List, Optional, Tuple
+
+import pytest
+
+from examples import registry
+from examples.example_objects import CallableExample
+
+try:
+    CollectReport = pytest.CollectReport
+except AttributeError:  # pragma: no cover - pytest < 7
+    from _pytest.reports import CollectReport
+
+NODE_ID_PREFIX = "examples::"
+
+
+def pytest_addoption(parser: Any) -> None:
+    group = parser.getgroup("examples")
+    group.addoption(
+        "--examples",
+        action="store_true",
+        help="Collect every registered example as its own test item.",
+    )
+    group.addoption(
+        "--examples-module",
+        action="append",
+        default=[],
+        dest="examples_modules",
+        help="Import this module before collecting examples, may be given multiple times.",
+    )
+    group.addoption(
+        "--examples-skip-types",
+        action="store_true",
+        help="Don't verify example types against their functions type annotations.",
+    )
+    parser.addini("examples_modules", "Modules whose examples to collect.", type="linelist")
+
+
+def _module_names(config: Any) -> List[str]:
+    return list(config.getini("examples_modules")) + list(config.getoption("examples_modules"))
+
+
+class ExampleItem(pytest.Item):
+    """A single registered example, verified then tested when run. Its node ID is
+       `examples::{module}.{qualname}[{index}]`, which stays the same between runs and
+       across pytest-xdist workers.
+    """
+
+    def __init__(self, *, example: CallableExample, **kwargs):
+        super().__init__(**kwargs)
+        self.example = example
+
+    def runtest(self) -> None:
+        self.example.verify_and_test(
+            verify_types=not self.config.getoption("examples_skip_types")
+        )
+
+    def repr_failure(self, excinfo: Any, style: Any = None) -> Any:
+        if excinfo.errisinstance(AssertionError):
+            return f"{excinfo.exconly()}\n\n{self.example!r}"
+        return super().repr_failure(excinfo, style=style)
+
+    def reportinfo(self) -> Tuple[Any, Optional[int], str]:
+        function = self.example.callable_object
+        try:
+            path = inspect.getsourcefile(function) or ""
+            line_number = function.__code__.co_firstlineno - 1
+        except (AttributeError, TypeError):
+            path, line_number = "", None
+        return path or getattr(self, "path", None) or self.fspath, line_number, self.name
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session: Any, config: Any, items: List[Any]) -> None:
+    """Adds an item per registered example. This runs first, so that `-k` and `--lf` apply
+       to the examples as well. No example is called while collecting.
+    """
+    module_names = _module_names(config)
+    if not (config.getoption("examples") or module_names):
+        return
+
+    root = str(getattr(config, "rootpath", None) or config.rootdir)
+    if module_names and root not in sys.path:
+        sys.path.insert(0, root)
+    for module_name in module_names:
+        importlib.import_module(module_name)
+
+    example_items: List[Any] = []
+    for module_examples in list(registry.module_registry.values()):
+        for example in module_examples.examples:
+            name = registry.example_id(example)
+            example_items.append(
+                ExampleItem.from_parent(
+                    session, name=name, nodeid=f"{NODE_ID_PREFIX}{name}", example=example
+                )
+            )
+    config.hook.pytest_collectreport(
+        report=CollectReport("examples", "passed", None, example_items)
+    )
+    items.extend(example_items)
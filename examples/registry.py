@@ -1,34 +1,170 @@
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from weakref import WeakKeyDictionary
 
-from examples.example_objects import CallableExample, NotDefined
+from examples import config
+from examples.example_objects import CallableExample, NotDefined, _tag_set
+from examples.results import ExampleResults
+
+
+def _qualname(function: Callable) -> str:
+    return str(
+        getattr(function, "__qualname__", None) or getattr(function, "__name__", repr(function))
+    )
+
+
+def _return_unchanged(function: Callable) -> Callable:
+    return function
+
+
+class _RegisteredExamples:
+    """The examples a single registry holds for a single function."""
+
+    __slots__ = ("examples", "undocumented")
+
+    def __init__(self):
+        self.examples: List[CallableExample] = []
+        self.undocumented: List[CallableExample] = []
 
 
 class Examples:
-    """An object that holds a set of examples as they are registered."""
+    """An object that holds a set of examples as they are registered.
+
+    Examples are stored on the functions they belong to, with the registry only weakly
+    referencing those functions. This way a function, its examples, and their arguments can
+    all be garbage collected together once nothing else references the function. Callables
+    that can't be weakly referenced or given attributes are instead held by the registry
+    until they are unregistered.
+    """
 
-    __slots__ = ("examples", "add_to_doc_strings", "_callable_mapping")
+    __slots__ = (
+        "add_to_doc_strings",
+        "_functions",
+        "_pinned",
+        "_qualname_index",
+        "_tag_index",
+        "__weakref__",
+    )
 
     def __init__(self, add_to_doc_strings: bool = True):
-        self.examples: List[CallableExample] = []
         self.add_to_doc_strings: bool = add_to_doc_strings
-        self._callable_mapping: Dict[Callable, list] = {}
+        self._functions: "WeakKeyDictionary[Callable, None]" = WeakKeyDictionary()
+        self._pinned: Dict[Callable, _RegisteredExamples] = {}
+        self._qualname_index: Dict[str, "WeakKeyDictionary[CallableExample, None]"] = {}
+        self._tag_index: Dict[str, "WeakKeyDictionary[CallableExample, None]"] = {}
+
+    def _index(self, example: CallableExample) -> None:
+        index_keys = [(self._qualname_index, _qualname(example.callable_object))]
+        index_keys.extend((self._tag_index, tag) for tag in example.tags)
+        for index, key in index_keys:
+            index.setdefault(key, WeakKeyDictionary())[example] = None
+
+    def _unindex(self, example: CallableExample) -> None:
+        index_keys = [(self._qualname_index, _qualname(example.callable_object))]
+        index_keys.extend((self._tag_index, tag) for tag in example.tags)
+        for index, key in index_keys:
+            indexed = index.get(key, None)
+            if indexed is not None:
+                indexed.pop(example, None)
+                if not indexed:
+                    del index[key]
+
+    def select(
+        self, qualname: Optional[str] = None, tags: Iterable[str] = ()
+    ) -> List[CallableExample]:
+        """Returns the examples of functions with the given `__qualname__` that are tagged with
+           every one of the given tags, using indexes so the cost scales with the results.
+        """
+        candidates: Optional[Iterable[CallableExample]] = None
+        if qualname is not None:
+            candidates = self._qualname_index.get(qualname, {})
+        for tag in sorted(_tag_set(tags), key=lambda tag: len(self._tag_index.get(tag, ()))):
+            tagged: Iterable[CallableExample] = self._tag_index.get(tag, {})
+            candidates = tagged if candidates is None else [
+                example for example in candidates if example in tagged
+            ]
+        return self.examples if candidates is None else list(candidates)
+
+    def _registered(self, function: Callable) -> Optional[_RegisteredExamples]:
+        registries = getattr(function, "__dict__", {}).get(EXAMPLES_ATTRIBUTE, None)
+        if registries is not None:
+            registered = registries.get(self, None)
+            if registered is not None:
+                return registered
+        return self._pinned.get(function, None)
+
+    def _register(self, function: Callable) -> _RegisteredExamples:
+        registered = self._registered(function)
+        if registered is not None:
+            return registered
+
+        registered = _RegisteredExamples()
+        try:
+            registries = getattr(function, "__dict__", {}).get(EXAMPLES_ATTRIBUTE, None)
+            if registries is None:
+                registries = WeakKeyDictionary()
+                setattr(function, EXAMPLES_ATTRIBUTE, registries)
+            self._functions[function] = None
+        except (AttributeError, TypeError):
+            self._pinned[function] = registered
+        else:
+            registries[self] = registered
+        return registered
+
+    @property
+    def functions(self) -> List[Callable]:
+        """All functions that currently have examples registered."""
+        return list(self._functions.keys()) + list(self._pinned)
+
+    @property
+    def examples(self) -> List[CallableExample]:
+        """All examples registered for functions that are still alive."""
+        examples: List[CallableExample] = []
+        for function in self.functions:
+            examples.extend(self.get(function))
+        return examples
 
-    def _add_to_doc_string(self, function: Callable, example: CallableExample) -> None:
-        if function.__doc__ is None:
-            function.__doc__ = ""
+    def _render_doc_string(self, function: Callable) -> None:
+        """Renders all not yet documented examples of a function into its doc string at once."""
+        registered = self._registered(function)
+        if registered is None or not registered.undocumented:
+            return
 
+        examples, registered.undocumented = registered.undocumented, []
+        doc_string = function.__doc__ or ""
         indent: int = 4
-        for line in reversed(function.__doc__.split("\n")):
+        for line in doc_string.split("\n"):
             if line.strip():
                 indent = len(line) - len(line.lstrip(" "))
+                break
         indent_spaces: str = " " * indent
 
-        if "Examples:" not in function.__doc__:
-            function.__doc__ += f"\n\n{indent_spaces}Examples:\n\n"
+        rendered = [doc_string]
+        if "Examples:" not in doc_string:
+            rendered.append(f"\n\n{indent_spaces}Examples:\n\n")
+        for example in examples:
+            indented_example = str(example).replace("\n", f"\n{indent_spaces}        ")
+            rendered.append(f"\n\n{indent_spaces}        {indented_example}\n-------")
+        function.__doc__ = "".join(rendered)
 
-        indented_example = str(example).replace("\n", f"\n{indent_spaces}        ")
-        function.__doc__ += f"\n\n{indent_spaces}        {indented_example}"
-        function.__doc__ += "\n-------"
+    def render_docs(self) -> None:
+        """Renders any examples that haven't yet been added to their functions doc strings."""
+        for function in self.functions:
+            self._render_doc_string(function)
+
+    def unregister(self, function: Callable) -> None:
+        """Removes all examples registered for the given function."""
+        for example in self.get(function):
+            self._unindex(example)
+        registries = getattr(function, "__dict__", {}).get(EXAMPLES_ATTRIBUTE, None)
+        if registries is not None:
+            registries.pop(self, None)
+        self._functions.pop(function, None)
+        self._pinned.pop(function, None)
+
+    def clear(self) -> None:
+        """Removes all registered examples."""
+        for function in self.functions:
+            self.unregister(function)
 
     def example(
         self,
@@ -36,16 +172,34 @@ class Examples:
         _example_returns: Any = NotDefined,
         _example_raises: Any = None,
         _example_doc_string: Optional[bool] = None,
+        _example_max_seconds: Optional[float] = None,
+        _example_max_memory: Optional[int] = None,
+        _example_tags: Iterable[str] = (),
+        _example_tolerance: Optional[float] = None,
         **kwargs,
     ) -> Callable:
+        if not config.enabled:
+            return _return_unchanged
+
         def example_wrapper(function):
             new_example = CallableExample(
-                function, returns=_example_returns, raises=_example_raises, args=args, kwargs=kwargs
+                function,
+                returns=_example_returns,
+                raises=_example_raises,
+                args=args,
+                kwargs=kwargs,
+                max_seconds=_example_max_seconds,
+                max_memory=_example_max_memory,
+                tags=_example_tags,
+                tolerance=_example_tolerance,
             )
-            self._callable_mapping.setdefault(function, []).append(new_example)
+            registered = self._register(function)
+            registered.examples.append(new_example)
+            self._index(new_example)
             if _example_doc_string or (_example_doc_string is None and self.add_to_doc_strings):
-                self._add_to_doc_string(function, new_example)
-            self.examples.append(new_example)
+                registered.undocumented.append(new_example)
+                if not config.lazy_doc_strings:
+                    self._render_doc_string(function)
             return function
 
         return example_wrapper
@@ -54,17 +208,91 @@ class Examples:
         for example in self.examples:
             example.verify_signature(verify_types=verify_types)
 
-    def test_examples(self, verify_return_type: bool = True) -> None:
-        for example in self.examples:
-            example.test(verify_return_type=verify_return_type)
+    def test_examples(
+        self, verify_return_type: bool = True, **run_options
+    ) -> Optional[ExampleResults]:
+        """Tests all examples, see `runner.run_tests` for the supported `run_options`."""
+        from examples import runner  # imported on first use, keeping `import examples` fast
 
-    def verify_and_test_examples(self, verify_types: bool = True) -> None:
-        for example in self.examples:
-            example.verify_and_test(verify_types=verify_types)
+        return runner.run_tests(self.examples, verify_return_type=verify_return_type, **run_options)
+
+    def verify_and_test_examples(
+        self, verify_types: bool = True, **run_options
+    ) -> Optional[ExampleResults]:
+        """Verifies then tests all examples, see `runner.run_tests` for the `run_options`."""
+        from examples import runner
+
+        return runner.run_tests(
+            self.examples, verify_return_type=verify_types, verify_signatures=True, **run_options
+        )
 
     def get(self, function: Callable) -> List[CallableExample]:
         """Returns back any examples registered for a specific function"""
-        return self._callable_mapping.get(function, [])
+        registered = self._registered(function)
+        return registered.examples if registered is not None else []
 
 
+EXAMPLES_ATTRIBUTE = "__examples__"
 module_registry: Dict[str, Examples] = {}
+package_index: Dict[str, Set[str]] = {}
+
+
+def registry_for(module_name: str) -> Examples:
+    """Returns the registry for the given module, creating and indexing it if needed."""
+    examples = module_registry.get(module_name, None)
+    if examples is None:
+        examples = module_registry[module_name] = Examples()
+        package = module_name
+        while package:
+            package_index.setdefault(package, set()).add(module_name)
+            package = package.rpartition(".")[0]
+    return examples
+
+
+def modules_in(package: str) -> List[str]:
+    """Returns the names of all modules with examples that are, or are within, the package."""
+    return sorted(name for name in package_index.get(package, ()) if name in module_registry)
+
+
+def unregister(function: Callable) -> None:
+    """Removes all examples registered for the given function from its modules registry."""
+    module_examples = module_registry.get(function.__module__, None)
+    if module_examples is not None:
+        module_examples.unregister(function)
+
+
+def clear() -> None:
+    """Removes all examples from every module registry."""
+    for module_examples in module_registry.values():
+        module_examples.clear()
+    module_registry.clear()
+    package_index.clear()
+
+
+def example_id(example: CallableExample) -> str:
+    """Returns a stable identifier for an example, made up of its functions qualified name and
+       the examples position amongst those registered for the function: `module.function[0]`.
+       Examples of functions sharing a qualified name, such as those made by a factory, are
+       numbered one after another in the order the functions were first registered.
+    """
+    function = example.callable_object
+    name = f"{function.__module__}.{function.__qualname__}"
+    module_examples = module_registry.get(function.__module__, None)
+    if module_examples is None:
+        return name
+
+    function_examples = module_examples.get(function)
+    for index, function_example in enumerate(function_examples):
+        if function_example is example:
+            break
+    else:
+        return name
+
+    qualname = _qualname(function)
+    if len(module_examples._qualname_index.get(qualname, ())) > len(function_examples):
+        for other_function in module_examples.functions:
+            if other_function is function:
+                break
+            if _qualname(other_function) == qualname:
+                index += len(module_examples.get(other_function))
+    return f"{name}[{index}]"
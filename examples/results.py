@@ -0,0 +1,176 @@
+import json
+from array import array
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from examples import registry
+from examples.example_objects import CallableExample
+
+Error = Tuple[str, str]
+
+
+class ExampleResult(NamedTuple):
+    """The outcome of running a single example, as read back from `ExampleResults`."""
+
+    module: str
+    name: str
+    seconds: float
+    error_type: Optional[str]
+    message: Optional[str]
+
+    @property
+    def passed(self) -> bool:
+        return self.error_type is None
+
+
+def error_of(exception: BaseException) -> Error:
+    """Returns the compact `(type name, message)` form failures are recorded in."""
+    return type(exception).__name__, str(exception)
+
+
+class ExampleResults:
+    """The outcomes of running many examples, as returned by the runners when `fail_fast`
+       is `False`.
+
+       Results are stored column by column rather than as an object per example: module
+       names are stored once each, durations in a packed array, and failures sparsely, so
+       that results stay small however many examples are run.
+    """
+
+    __slots__ = ("modules", "_module_indexes", "module_ids", "names", "durations", "errors")
+
+    def __init__(self):
+        self.modules: List[str] = []
+        self._module_indexes: Dict[str, int] = {}
+        self.module_ids = array("I")
+        self.names: List[str] = []
+        self.durations = array("d")
+        self.errors: Dict[int, Error] = {}
+
+    def append(self, example: CallableExample, seconds: float, error: Optional[Error]) -> None:
+        """Records the outcome of running an example, `error` being `None` if it passed."""
+        module = getattr(example.callable_object, "__module__", None) or ""
+        module_index = self._module_indexes.get(module, None)
+        if module_index is None:
+            module_index = self._module_indexes[module] = len(self.modules)
+            self.modules.append(module)
+
+        name = registry.example_id(example)
+        if module and name.startswith(f"{module}."):
+            name = name[len(module) + 1 :]
+
+        if error is not None:
+            self.errors[len(self.names)] = error
+        self.module_ids.append(module_index)
+        self.names.append(name)
+        self.durations.append(seconds)
+
+    def extend(self, other: "ExampleResults") -> None:
+        """Appends every result of another `ExampleResults`."""
+        for result in other:
+            module_index = self._module_indexes.get(result.module, None)
+            if module_index is None:
+                module_index = self._module_indexes[result.module] = len(self.modules)
+                self.modules.append(result.module)
+            if not result.passed:
+                self.errors[len(self.names)] = (result.error_type or "", result.message or "")
+            self.module_ids.append(module_index)
+            self.names.append(result.name)
+            self.durations.append(result.seconds)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> ExampleResult:
+        if index < 0:
+            index += len(self.names)
+        error_type, message = self.errors.get(index, (None, None))
+        return ExampleResult(
+            self.modules[self.module_ids[index]],
+            self.names[index],
+            self.durations[index],
+            error_type,
+            message,
+        )
+
+    def __iter__(self) -> Iterator[ExampleResult]:
+        for index in range(len(self.names)):
+            yield self[index]
+
+    @property
+    def passed(self) -> int:
+        return len(self.names) - len(self.errors)
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+    @property
+    def seconds(self) -> float:
+        return sum(self.durations)
+
+    def failures(self) -> List[ExampleResult]:
+        return [self[index] for index in sorted(self.errors)]
+
+    def raise_for_failures(self) -> None:
+        """Raises an `AssertionError` describing every failed example, if any failed."""
+        if self.errors:
+            raise AssertionError(str(self))
+
+    def write_json_lines(self, path: str) -> None:
+        """Writes a JSON object per example, one per line, into the given file."""
+        with open(path, "w") as json_file:
+            for result in self:
+                json.dump(
+                    {
+                        "module": result.module,
+                        "name": result.name,
+                        "passed": result.passed,
+                        "seconds": result.seconds,
+                        "error_type": result.error_type,
+                        "message": result.message,
+                    },
+                    json_file,
+                )
+                json_file.write("\n")
+
+    def write_junit_xml(self, path: str, suite_name: str = "examples") -> None:
+        """Writes the results into the given file in the JUnit XML format understood by most
+           CI servers, with each module as a test class.
+        """
+        # ElementTree only writes the report here, it never parses XML
+        from xml.etree import ElementTree  # nosec B405
+
+        suite = ElementTree.Element(
+            "testsuite",
+            name=suite_name,
+            tests=str(len(self)),
+            failures=str(self.failed),
+            errors="0",
+            time=f"{self.seconds:.6f}",
+        )
+        for result in self:
+            case = ElementTree.SubElement(
+                suite,
+                "testcase",
+                classname=result.module,
+                name=result.name,
+                time=f"{result.seconds:.6f}",
+            )
+            if not result.passed:
+                failure = ElementTree.SubElement(
+                    case, "failure", type=result.error_type or "", message=result.message or ""
+                )
+                failure.text = result.message
+        ElementTree.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
+
+    def __str__(self):
+        summary = f"{self.passed} passed, {self.failed} failed in {self.seconds:.3f}s"
+        for failure in self.failures():
+            summary += (
+                f"\n\nFAILED {failure.module}.{failure.name}: "
+                f"{failure.error_type}: {failure.message}"
+            )
+        return summary
+
+    def __repr__(self):
+        return f"ExampleResults({self.passed} passed, {self.failed} failed)"
@@ -0,0 +1,407 @@
+import asyncio
+import inspect
+# pickle only checks that examples can be sent to worker processes, it never loads anything
+import pickle  # nosec B403
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from examples import isolation, registry, sharding
+from examples.cache import ResultCache, fingerprint
+from examples.example_objects import (
+    CallableExample,
+    NotDefined,
+    test_examples_by_callable,
+    validate_returns_by_callable,
+)
+from examples.hooks import ExampleHook, using_hooks
+from examples.results import Error, ExampleResults, error_of
+
+BACKENDS: Dict[str, Callable[..., Executor]] = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+
+def _test_example(example: CallableExample, verify_return_type: bool = True) -> None:
+    example.test(verify_return_type=verify_return_type)
+
+
+def _verify_and_test_example(example: CallableExample, verify_types: bool = True) -> None:
+    example.verify_and_test(verify_types=verify_types)
+
+
+def _collect_example(
+    example: CallableExample, verify_return_type: bool = True, verify_signatures: bool = False
+) -> Tuple[float, Optional[Error]]:
+    start = time.perf_counter()
+    try:
+        if verify_signatures:
+            example.verify_and_test(verify_types=verify_return_type)
+        else:
+            example.test(verify_return_type=verify_return_type)
+    except Exception as exception:
+        return time.perf_counter() - start, error_of(exception)
+    return time.perf_counter() - start, None
+
+
+def _runs_alone(example: CallableExample, backend: str) -> bool:
+    """Examples with memory budgets aren't run within thread pools, as their allocations can
+       only be measured while running on their own.
+    """
+    return backend == "thread" and example.max_memory is not None
+
+
+def _is_picklable(example: CallableExample) -> bool:
+    try:
+        pickle.dumps(example)
+    except Exception:
+        return False
+    return True
+
+
+def run_in_pool(
+    examples: Iterable[CallableExample],
+    action: Callable[[CallableExample], None],
+    workers: int,
+    backend: str = "thread",
+    on_pass: Optional[Callable[[CallableExample], None]] = None,
+) -> None:
+    """Runs the given action against every example across a pool of workers.
+
+    - *workers*: The maximum number of threads or processes to fan the examples out over.
+    - *backend*: Either `"thread"` or `"process"`. When using processes, examples whose
+      callables or arguments can't be pickled fall back to running in the parent process.
+      When using threads, examples with memory budgets are run one after another once the
+      pool is done, see `_runs_alone`.
+    - *on_pass*: Called with each example that the action completes for without raising.
+
+    The first failing example (in the order given) has its exception re-raised. For the
+    process backend, the worker's traceback is attached as the exception's cause.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {', '.join(BACKENDS)}.")
+
+    pooled: List[CallableExample] = []
+    local: List[CallableExample] = []
+    alone: List[CallableExample] = []
+    for example in examples:
+        if _runs_alone(example, backend):
+            alone.append(example)
+        elif backend == "process" and not _is_picklable(example):
+            local.append(example)
+        else:
+            pooled.append(example)
+
+    with BACKENDS[backend](max_workers=workers) as executor:
+        futures = [executor.submit(action, example) for example in pooled]
+        try:
+            for example in local:
+                action(example)
+                if on_pass:
+                    on_pass(example)
+            for example, future in zip(pooled, futures):
+                future.result()
+                if on_pass:
+                    on_pass(example)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    for example in alone:
+        action(example)
+        if on_pass:
+            on_pass(example)
+
+
+def collect_in_pool(
+    examples: List[CallableExample],
+    action: Callable[[CallableExample], Tuple[float, Optional[Error]]],
+    workers: int,
+    backend: str = "thread",
+) -> List[Tuple[float, Optional[Error]]]:
+    """Like `run_in_pool`, but returns the `(seconds, error)` outcome the action returns for
+       every example, in the order given, instead of stopping at the first failure.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {', '.join(BACKENDS)}.")
+
+    outcomes: Dict[int, Any] = {}
+    alone: Dict[int, CallableExample] = {}
+    with BACKENDS[backend](max_workers=workers) as executor:
+        for index, example in enumerate(examples):
+            if _runs_alone(example, backend):
+                alone[index] = example
+            elif backend == "process" and not _is_picklable(example):
+                outcomes[index] = action(example)
+            else:
+                outcomes[index] = executor.submit(action, example)
+        for index, outcome in outcomes.items():
+            if not isinstance(outcome, tuple):
+                outcomes[index] = outcome.result()
+
+    for index, example in alone.items():
+        outcomes[index] = action(example)
+    return [outcomes[index] for index in range(len(examples))]
+
+
+async def _gather_examples(
+    examples: List[CallableExample], limit: Optional[int], timeout: Optional[float]
+) -> List[Any]:
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def run_example(example: CallableExample) -> Any:
+        if semaphore is None:
+            return await example._run_and_check_async(timeout=timeout)
+        async with semaphore:
+            return await example._run_and_check_async(timeout=timeout)
+
+    return await asyncio.gather(
+        *(run_example(example) for example in examples), return_exceptions=True
+    )
+
+
+def test_gathered(
+    examples: List[CallableExample],
+    verify_return_type: bool = True,
+    limit: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> None:
+    """Tests the given coroutine function examples concurrently on a single new event loop.
+
+    - *limit*: The maximum number of examples that may be running at once.
+    - *timeout*: The number of seconds each example is given to complete before it fails.
+
+    The first failing example (in the order given) has its exception re-raised.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        results = loop.run_until_complete(_gather_examples(examples, limit, timeout))
+    finally:
+        loop.close()
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    if verify_return_type:
+        validate_returns_by_callable(examples, results)
+
+
+def collect_gathered(
+    examples: List[CallableExample],
+    verify_return_type: bool = True,
+    verify_signatures: bool = False,
+    limit: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> List[Tuple[float, Optional[Error]]]:
+    """Like `test_gathered`, but returns the `(seconds, error)` outcome of every example, in
+       the order given, instead of stopping at the first failure.
+    """
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def run_example(example: CallableExample) -> Tuple[float, Optional[Error]]:
+        start = time.perf_counter()
+        try:
+            if verify_signatures:
+                example.verify_signature(verify_types=verify_return_type)
+            if semaphore is None:
+                result = await example._run_and_check_async(timeout=timeout)
+            else:
+                async with semaphore:
+                    result = await example._run_and_check_async(timeout=timeout)
+            seconds = time.perf_counter() - start
+            if verify_return_type and result is not NotDefined:
+                validate_returns_by_callable([example], [result])
+        except Exception as exception:
+            return time.perf_counter() - start, error_of(exception)
+        return seconds, None
+
+    async def run_examples() -> List[Tuple[float, Optional[Error]]]:
+        return await asyncio.gather(*(run_example(example) for example in examples))
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(run_examples())
+    finally:
+        loop.close()
+
+
+def _gatherable(example: CallableExample) -> bool:
+    """Examples with memory budgets aren't gathered, as their allocations can only be measured
+       while running on their own.
+    """
+    return example.max_memory is None and inspect.iscoroutinefunction(example.callable_object)
+
+
+def run_tests(
+    examples: Iterable[CallableExample],
+    verify_return_type: bool = True,
+    verify_signatures: bool = False,
+    workers: int = 1,
+    backend: str = "thread",
+    gather_async: bool = False,
+    async_limit: Optional[int] = None,
+    async_timeout: Optional[float] = None,
+    cache_dir: Optional[str] = None,
+    force: bool = False,
+    hooks: Sequence[ExampleHook] = (),
+    shard_index: int = 0,
+    shard_count: int = 1,
+    durations: Optional[str] = None,
+    record_durations: Optional[str] = None,
+    fail_fast: bool = True,
+    isolate: bool = False,
+    timeout: Optional[float] = None,
+) -> Optional[ExampleResults]:
+    """Tests all given examples, the backbone of every `test_examples` style runner.
+
+    - *verify_return_type*: If `True` return values are checked against type annotations.
+    - *verify_signatures*: If `True` each examples signature is verified before it is tested.
+    - *workers*: If more than `1`, examples are fanned out across a pool of this many workers.
+    - *backend*: The kind of pool to use when `workers` is set, either `"thread"` or `"process"`.
+    - *gather_async*: If `True` all coroutine function examples are run concurrently on one
+      event loop, instead of one after another. Other examples run as they otherwise would.
+    - *async_limit*: The maximum number of gathered examples that may be running at once.
+    - *async_timeout*: The number of seconds each gathered example is given to complete.
+    - *cache_dir*: A directory to record passing examples in. Examples that passed in a
+      previous run and haven't changed since, as judged by `cache.fingerprint`, are skipped.
+    - *force*: If `True` all examples are run even if they are recorded as passing in the cache.
+    - *hooks*: `ExampleHook`s to install for the duration of the run, such as the profiling
+      hooks in `examples.profiling`. Hooks aren't carried over into process pool workers.
+    - *shard_index* and *shard_count*: Only run the deterministic slice `shard_index` (counting
+      from `0`) of `shard_count` slices of the examples, see `sharding.shard`.
+    - *durations*: A JSON file of example durations from a previous run, used to balance
+      shards so each takes roughly equal wall-clock time.
+    - *record_durations*: A JSON file to merge the durations of examples run into.
+    - *fail_fast*: If `True` (the default) the first failing example has its exception raised.
+      If `False` every example is run and an `ExampleResults` of their outcomes is returned.
+    - *isolate*: If `True` examples are run within `workers` forked worker processes, see
+      `isolation.run_isolated`, so that examples that crash or hang can't take the run down
+      with them. Every example is run even when failing fast, and `gather_async` is ignored.
+    - *timeout*: The number of seconds each isolated example is given to complete before its
+      worker is killed and the example fails.
+    """
+    examples = list(examples)
+    if shard_count > 1 or shard_index:
+        examples = sharding.shard(
+            examples,
+            shard_index,
+            shard_count,
+            durations=sharding.load_durations(durations) if durations else None,
+        )
+    duration_hook: Optional[sharding.DurationHook] = None
+    if record_durations:
+        duration_hook = sharding.DurationHook()
+        hooks = (*hooks, duration_hook)
+    result_cache: Optional[ResultCache] = None
+    fingerprints: Dict[int, str] = {}
+    if cache_dir is not None:
+        result_cache = ResultCache(cache_dir)
+        fingerprints = {
+            id(example): fingerprint(example, verify_return_type, verify_signatures)
+            for example in examples
+        }
+        if not force:
+            examples = [
+                example
+                for example in examples
+                if not result_cache.passed(fingerprints[id(example)])
+            ]
+
+    def record_pass(*passed: CallableExample) -> None:
+        if result_cache is not None:
+            for example in passed:
+                result_cache.record(fingerprints[id(example)], example)
+
+    gathered: List[CallableExample] = []
+    if gather_async and not isolate:
+        gathered = [example for example in examples if _gatherable(example)]
+        examples = [example for example in examples if not _gatherable(example)]
+
+    try:
+        with using_hooks(*hooks):
+            collect = partial(
+                _collect_example,
+                verify_return_type=verify_return_type,
+                verify_signatures=verify_signatures,
+            )
+            if isolate:
+                outcomes = isolation.run_isolated(
+                    examples, collect, workers=max(workers, 1), timeout=timeout
+                )
+                results = ExampleResults()
+                for example, (seconds, error) in zip(examples, outcomes):
+                    results.append(example, seconds, error)
+                    if duration_hook is not None:
+                        duration_hook.after(example, seconds, None)
+                    if error is None:
+                        record_pass(example)
+                    elif fail_fast:
+                        raise AssertionError(
+                            f"Example {registry.example_id(example)} failed with "
+                            f"{error[0]}: {error[1]}"
+                        )
+                return None if fail_fast else results
+
+            if not fail_fast:
+                if workers > 1:
+                    outcomes = collect_in_pool(examples, collect, workers=workers, backend=backend)
+                else:
+                    outcomes = [collect(example) for example in examples]
+                if gathered:
+                    outcomes += collect_gathered(
+                        gathered,
+                        verify_return_type=verify_return_type,
+                        verify_signatures=verify_signatures,
+                        limit=async_limit,
+                        timeout=async_timeout,
+                    )
+
+                results = ExampleResults()
+                for example, (seconds, error) in zip(examples + gathered, outcomes):
+                    results.append(example, seconds, error)
+                    if error is None:
+                        record_pass(example)
+                return results
+
+            if workers > 1:
+                action = (
+                    partial(_verify_and_test_example, verify_types=verify_return_type)
+                    if verify_signatures
+                    else partial(_test_example, verify_return_type=verify_return_type)
+                )
+                run_in_pool(examples, action, workers=workers, backend=backend, on_pass=record_pass)
+            elif verify_signatures:
+                for example in examples:
+                    example.verify_and_test(verify_types=verify_return_type)
+                    record_pass(example)
+            else:
+                grouped_examples: Dict[Callable, List[CallableExample]] = {}
+                for example in examples:
+                    grouped_examples.setdefault(example.callable_object, []).append(example)
+                for callable_examples in grouped_examples.values():
+                    test_examples_by_callable(
+                        callable_examples, verify_return_type=verify_return_type
+                    )
+                    record_pass(*callable_examples)
+
+            if gathered:
+                if verify_signatures:
+                    for example in gathered:
+                        example.verify_signature(verify_types=verify_return_type)
+                test_gathered(
+                    gathered,
+                    verify_return_type=verify_return_type,
+                    limit=async_limit,
+                    timeout=async_timeout,
+                )
+                record_pass(*gathered)
+    finally:
+        if result_cache is not None:
+            result_cache.prune()
+        if duration_hook is not None and record_durations:
+            duration_hook.save(record_durations)
+    return None
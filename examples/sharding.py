@@ -0,0 +1,89 @@
+import hashlib
+import json
+import os
+import threading
+from statistics import median
+from typing import Any, Dict, List, Optional, Sequence
+
+from examples import registry
+from examples.example_objects import CallableExample
+from examples.hooks import ExampleHook
+
+
+def _stable_hash(name: str) -> int:
+    return int(hashlib.sha1(name.encode()).hexdigest(), 16)  # nosec
+
+
+def shard(
+    examples: Sequence[CallableExample],
+    shard_index: int,
+    shard_count: int,
+    durations: Optional[Dict[str, float]] = None,
+) -> List[CallableExample]:
+    """Returns the slice of the given examples that belong to the shard `shard_index` of
+       `shard_count`, in their original order.
+
+       Every node that shards the same examples gets a disjoint slice without coordination.
+       Without `durations`, examples are split by a stable hash of their `registry.example_id`.
+       With `durations` (seconds per example id, from a previous run), examples are instead
+       greedily assigned to whichever shard has the least total duration so far, longest
+       first, so that shards take roughly equal wall-clock time. Examples without a recorded
+       duration are assumed to take the median duration.
+    """
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(
+            f"shard_index must be at least 0 and less than shard_count ({shard_count}), "
+            f"not {shard_index}."
+        )
+
+    names = [registry.example_id(example) for example in examples]
+    if not durations:
+        return [
+            example
+            for example, name in zip(examples, names)
+            if _stable_hash(name) % shard_count == shard_index
+        ]
+
+    default_duration = median(durations.values())
+    expected = [durations.get(name, default_duration) for name in names]
+    order = sorted(
+        range(len(examples)), key=lambda index: (-expected[index], names[index], index)
+    )
+    totals = [0.0] * shard_count
+    selected = []
+    for index in order:
+        assigned = min(range(shard_count), key=lambda candidate: (totals[candidate], candidate))
+        totals[assigned] += expected[index]
+        if assigned == shard_index:
+            selected.append(index)
+    return [examples[index] for index in sorted(selected)]
+
+
+def load_durations(path: str) -> Dict[str, float]:
+    """Loads recorded durations (seconds per example id) from a JSON file, if it exists."""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as durations_file:
+        return json.load(durations_file)["durations"]
+
+
+class DurationHook(ExampleHook):
+    """Records how long every example call takes, for balancing future shards."""
+
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def after(self, example: Any, seconds: float, exception: Optional[BaseException]) -> None:
+        name = registry.example_id(example)
+        with self._lock:
+            self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    def save(self, path: str) -> None:
+        """Merges the recorded durations into the given JSON file."""
+        durations = load_durations(path)
+        durations.update(self.durations)
+        with open(path, "w") as durations_file:
+            json.dump(
+                {"version": 1, "durations": durations}, durations_file, indent=2, sort_keys=True
+            )
@@ -0,0 +1,97 @@
+import inspect
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, get_type_hints
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
+
+
+class SignatureValidator:
+    """Holds the signature, resolved type hints, and pydantic models for a single callable,
+       so they only need to be built once no matter how many examples are verified against it.
+    """
+
+    __slots__ = (
+        "signature",
+        "type_hints",
+        "fingerprint",
+        "_models",
+        "_returns_model",
+    )
+
+    def __init__(self, callable_object: Callable):
+        self.signature = inspect.signature(callable_object)
+        self.type_hints: Dict[str, Any] = get_type_hints(callable_object)
+        self.fingerprint = _fingerprint(callable_object)
+        self._models: Dict[Tuple[str, ...], Type[BaseModel]] = {}
+        self._returns_model: Optional[Type[BaseModel]] = None
+
+    def bind(self, args, kwargs) -> inspect.BoundArguments:
+        """Binds the given arguments against the callables signature."""
+        return self.signature.bind(*args, **kwargs)
+
+    def model(self, field_names: Tuple[str, ...]) -> Type[BaseModel]:
+        """Returns a pydantic model covering the given fields, reusing it across calls.
+           The special `returns` field is checked against the callables return annotation.
+        """
+        model = self._models.get(field_names, None)
+        if model is None:
+            test_type_hints = {
+                name: self.type_hints.get("return" if name == "returns" else name, None)
+                for name in field_names
+            }
+
+            class ExamplesModel(BaseModel):
+                __annotations__ = test_type_hints
+
+            model = self._models[field_names] = ExamplesModel
+        return model
+
+    def validate(self, values: Dict[str, Any]) -> None:
+        """Validates the given field values against the callables type hints."""
+        self.model(tuple(values))(**values)
+
+    def returns_model(self) -> Type[BaseModel]:
+        """Returns a pydantic model that validates a list of return values in one pass."""
+        if self._returns_model is None:
+            return_type = self.type_hints["return"]
+
+            class ExampleReturnsModel(BaseModel):
+                __annotations__ = {"returns": List[return_type]}  # type: ignore
+
+            self._returns_model = ExampleReturnsModel
+        return self._returns_model
+
+    def validate_returns(self, results: List[Any]) -> None:
+        """Validates a batch of return values against the callables return type hint.
+           Any resulting `ValidationError` locates failures as `("returns", index)`.
+        """
+        if "return" in self.type_hints:
+            self.returns_model()(returns=results)
+
+
+_validators: "WeakKeyDictionary[Callable, SignatureValidator]" = WeakKeyDictionary()
+
+
+def _fingerprint(callable_object: Callable) -> tuple:
+    """Returns the parts of a callable that, when changed, invalidate its cached validator."""
+    return (
+        getattr(callable_object, "__code__", None),
+        getattr(callable_object, "__defaults__", None),
+        getattr(callable_object, "__kwdefaults__", None),
+        getattr(callable_object, "__signature__", None),
+        tuple(getattr(callable_object, "__annotations__", {}).items()),
+    )
+
+
+def get_validator(callable_object: Callable) -> SignatureValidator:
+    """Returns the cached validator for the given callable, building a new one if the callable
+       has not been seen before or has changed since its validator was built.
+    """
+    try:
+        validator = _validators.get(callable_object, None)
+    except TypeError:  # pragma: no cover
+        return SignatureValidator(callable_object)
+
+    if validator is None or validator.fingerprint != _fingerprint(callable_object):
+        validator = _validators[callable_object] = SignatureValidator(callable_object)
+    return validator
@@ -0,0 +1,107 @@
+import importlib
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from examples import api, registry
+from examples.results import ExampleResults
+
+
+class Watcher:
+    """Polls the source files of every module with registered examples, along with their
+       companion examples modules (such as `api_examples.py` for `api.py`), for changes.
+    """
+
+    __slots__ = ("suffix", "_modified")
+
+    def __init__(self, suffix: str = "_examples"):
+        self.suffix = suffix
+        self._modified: Dict[str, int] = {}
+        self.changed()
+
+    def _watched_files(self) -> Dict[str, str]:
+        files = {}
+        for module_name in list(registry.module_registry):
+            for name in (module_name, f"{module_name}{self.suffix}"):
+                path = getattr(sys.modules.get(name, None), "__file__", None)
+                if path:
+                    files[path] = module_name
+        return files
+
+    def changed(self) -> List[str]:
+        """Returns the modules with registered examples whose source files, or companion
+           examples modules, changed since the last call.
+        """
+        affected = set()
+        for path, module_name in self._watched_files().items():
+            try:
+                modified = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            previously_modified = self._modified.get(path, None)
+            self._modified[path] = modified
+            if previously_modified is not None and previously_modified != modified:
+                affected.add(module_name)
+        return sorted(affected)
+
+    def reload(self, module_names: List[str]) -> None:
+        """Reloads the given modules followed by their companion examples modules, replacing
+           their previously registered examples. No other modules are reloaded.
+        """
+        for module_name in module_names:
+            module_examples = registry.module_registry.get(module_name, None)
+            if module_examples is not None:
+                module_examples.clear()
+            importlib.reload(sys.modules[module_name])
+            companion = sys.modules.get(f"{module_name}{self.suffix}", None)
+            if companion is not None:
+                importlib.reload(companion)
+
+    def run_changed(
+        self, verify_types: bool = True, output: Callable[[str], Any] = print, **run_options
+    ) -> Optional[float]:
+        """Reloads, then verifies and tests the examples of, every changed module, reporting the
+           results through `output`. Returns the seconds taken, or `None` if nothing changed.
+        """
+        module_names = self.changed()
+        if not module_names:
+            return None
+
+        start = time.perf_counter()
+        results = ExampleResults()
+        for module_name in module_names:
+            try:
+                self.reload([module_name])
+            except Exception as exception:
+                output(f"Failed to reload {module_name}: {type(exception).__name__}: {exception}")
+                continue
+            if not registry.module_registry[module_name].examples:
+                continue
+            module_results = api.verify_and_test_examples(
+                module_name, verify_types=verify_types, fail_fast=False, **run_options
+            )
+            if module_results is not None:  # only `None` when failing fast
+                results.extend(module_results)
+        seconds = time.perf_counter() - start
+        output(f"{', '.join(module_names)}: {results}\nRe-ran in {seconds:.3f}s.")
+        return seconds
+
+
+def watch(
+    interval: float = 0.5,
+    verify_types: bool = True,
+    output: Callable[[str], Any] = print,
+    **run_options,
+) -> None:
+    """Runs until interrupted, reloading and re-running the examples of modules as their files
+       change, and reporting the results and latency of each run through `output`.
+
+       - *interval*: The number of seconds to wait between checking files for changes.
+       - *run_options*: Control how the examples are run, see `examples.runner.run_tests`.
+    """
+    watcher = Watcher()
+    output(f"Watching {len(watcher._modified)} files for changes.")
+    while True:
+        watcher.run_changed(verify_types=verify_types, output=output, **run_options)
+        time.sleep(interval)
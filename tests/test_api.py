@@ -1,7 +1,15 @@
+import asyncio
+import copy
+import time
+import tracemalloc
+from typing import List
+
 import pytest
 
+import examples
 from examples import api
-from examples.example_objects import CallableExample
+from examples.example_objects import CallableExample, _BudgetMeter
+from examples.registry import Examples
 
 from . import example_module_fail, example_module_pass, no_examples_module
 
@@ -187,3 +195,190 @@ def test_async_example():
         return number_1
 
     api.verify_and_test_examples(my_function)
+
+
+def test_time_budgets():
+    @api.example(0, _example_max_seconds=1)
+    @api.example(0.2, _example_max_seconds=0.01)
+    def sleep(seconds: float) -> None:
+        time.sleep(seconds)
+
+    slow, fast = api.get_examples(sleep)
+    fast.test()
+    with pytest.raises(AssertionError):
+        slow.test()
+
+    @api.example(0.2, _example_max_seconds=0.01)
+    async def async_sleep(seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+    with pytest.raises(AssertionError):
+        api.test_examples(async_sleep)
+    with pytest.raises(AssertionError):
+        api.test_examples(async_sleep, gather_async=True)
+
+
+def test_memory_budgets():
+    def allocate(size: int) -> int:
+        return len(bytearray(size))
+
+    api.add_example_to(allocate)(1000, _example_max_memory=1000000)
+    api.add_example_to(allocate)(1000000, _example_max_memory=1000)
+
+    small, large = api.get_examples(allocate)
+    small.test()
+    with pytest.raises(AssertionError):
+        large.test()
+
+
+def test_memory_budgets_in_thread_pools():
+    my_examples = Examples()
+
+    @my_examples.example(0.2, _example_max_memory=1000)
+    @my_examples.example(0.1, _example_max_memory=1000)
+    def sleep_and_allocate(seconds: float) -> int:
+        time.sleep(seconds)
+        return len(bytearray(5_000_000))
+
+    results = my_examples.test_examples(workers=2, fail_fast=False)
+    assert results.failed == 2
+    with pytest.raises(AssertionError):
+        my_examples.test_examples(workers=2)
+    assert not tracemalloc.is_tracing()
+
+    first, second = _BudgetMeter(measure_memory=True), _BudgetMeter(measure_memory=True)
+    first.stop()
+    assert tracemalloc.is_tracing()
+    second.stop()
+    assert not tracemalloc.is_tracing()
+
+
+def test_select_examples():
+    @api.example(1, _example_tags={"fast", "math"})
+    @api.example(2, _example_tags={"slow", "math"})
+    @api.example(3)
+    def square(number: int) -> int:
+        return number * number
+
+    api.add_example_to(square)(4, _example_tags="fast")
+    assert api.get_examples(square)[-1].tags == {"fast"}
+
+    fast_examples = api.select_examples(package=__name__, tags={"fast"})
+    assert [selected.args for selected in fast_examples] == [(1,), (4,)]
+    assert [selected.args for selected in api.select_examples(tags={"fast", "math"})] == [(1,)]
+    assert len(api.select_examples(package=__name__, qualname=square.__qualname__)) == 4
+    assert api.select_examples(package=__name__, tags={"missing"}) == []
+    assert api.select_examples(package=__name__, tags="fast") == fast_examples
+    assert api.select_examples(package=example_module_pass.__name__) == api.get_examples(
+        example_module_pass
+    )
+    assert len(api.select_examples(package="tests")) > len(fast_examples)
+
+    api.verify_signatures(fast_examples)
+    api.test_examples(fast_examples)
+    api.verify_and_test_examples(fast_examples)
+    for runner_function in (api.verify_signatures, api.test_examples, api.verify_and_test_examples):
+        with pytest.raises(ValueError):
+            runner_function([])
+
+
+def test_lazy_arguments():
+    created = []
+
+    def big_numbers():
+        created.append("numbers")
+        return list(range(1000))
+
+    @api.example(api.lazy(big_numbers), _example_returns=api.lazy(lambda: 499500, name="total"))
+    @api.example(numbers=api.lazy(lambda: [1, 2], cache=False, name="small_numbers"))
+    def sum_numbers(numbers: List[int]) -> int:
+        return sum(numbers)
+
+    assert not created
+    assert "big_numbers()" in sum_numbers.__doc__
+    assert "total()" in sum_numbers.__doc__
+
+    api.verify_signatures(sum_numbers, verify_types=False)
+    assert not created
+
+    api.verify_and_test_examples(sum_numbers)
+    api.test_examples(sum_numbers)
+    assert created == ["numbers"]
+    assert api.get_examples(sum_numbers)[0].use() == 3
+
+    try:
+        examples.configure(lazy_cache_size=0)
+        api.test_examples(sum_numbers)
+        assert created == ["numbers", "numbers"]
+    finally:
+        examples.configure(lazy_cache_size=32)
+
+
+def test_reassigned_lazy_arguments():
+    @api.example(1, _example_returns=1)
+    def identity(value: int) -> int:
+        return value
+
+    (identity_example,) = api.get_examples(identity)
+    assert not identity_example.has_lazy_arguments
+    identity_example.test()
+
+    identity_example.args = (api.lazy(lambda: 1),)
+    assert identity_example.has_lazy_arguments
+    assert identity_example.use() == 1
+    identity_example.test()
+
+
+def test_lazy_async_arguments():
+    @api.example(api.lazy(lambda: 2), _example_returns=4)
+    async def double(number: int) -> int:
+        return number * 2
+
+    api.test_examples(double)
+    api.test_examples(double, gather_async=True)
+
+
+def test_call_plans():
+    @api.example(2, _example_returns=4)
+    @api.example(_example_raises=ValueError("no number"))
+    def double(number: int = None) -> int:
+        if number is None:
+            raise ValueError("no number")
+        return number * 2
+
+    raising, returning = api.get_examples(double)
+    api.test_examples(double)
+    plan = returning._call_plan()
+    api.test_examples(double)
+    assert returning._call_plan() is plan  # built once, then reused
+
+    returning.returns = 5
+    assert returning._call_plan() is not plan
+    with pytest.raises(AssertionError):
+        returning.test()
+    returning.args = (2.5,)
+    returning.test()
+
+    raising.raises = ValueError("another reason")
+    with pytest.raises(AssertionError):
+        raising.test()
+
+    copied = copy.copy(returning)
+    assert copied._plan is None
+    copied.test()
+
+
+def test_example_arguments_are_frozen():
+    @api.example(number=1, _example_returns=1)
+    def identity(number: int) -> int:
+        return number
+
+    (identity_example,) = api.get_examples(identity)
+    identity_example.test()
+    with pytest.raises(TypeError):
+        identity_example.kwargs["number"] = 5  # type: ignore
+
+    identity_example.kwargs = {"number": 5}
+    assert identity_example.use() == 5
+    identity_example.args = [2]
+    assert identity_example.args == (2,)
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from examples import api, benchmark
+
+from . import example_module_pass
+
+
+def test_benchmark_examples(tmpdir):
+    baseline = str(tmpdir.join("baseline.json"))
+    results = benchmark.benchmark_examples(
+        example_module_pass, repeat=3, min_time=0.0001, baseline=baseline, save=True
+    )
+    assert len(results) == len(benchmark.get_examples(example_module_pass))
+    for result in results:
+        assert result.min <= result.median <= result.p99
+        assert result.change is None and not result.regressed
+        assert result.name in str(result) and "BenchmarkResult" in repr(result)
+
+    with open(baseline) as baseline_file:
+        saved = json.load(baseline_file)["examples"]
+    assert "tests.example_module_pass.add[0]" in saved
+
+    results = benchmark.benchmark_examples(
+        example_module_pass.add, repeat=3, min_time=0.0001, baseline=baseline, threshold=-1
+    )
+    assert all(result.regressed for result in results)
+    assert "REGRESSED" in str(results[0])
+
+
+def test_result_statistics():
+    result = benchmark.BenchmarkResult("example", 1, [3.0, 1.0, 2.0], baseline=2.0)
+    assert (result.min, result.median, result.p99) == (1.0, 2.0, 3.0)
+    assert result.change == -0.5
+    assert not result.regressed
+    assert "1s" in str(result) and "-50.0%" in str(result)
+
+
+def test_compare_implementations():
+    @api.example(3, _example_returns=6)
+    @api.example(-1, _example_raises=ValueError("negative"))
+    def slow_double(number: int) -> int:
+        if number < 0:
+            raise ValueError("negative")
+        return sum(number for _ in range(2))
+
+    def fast_double(number: int) -> int:
+        if number < 0:
+            raise ValueError("negative")
+        return number * 2
+
+    def wrong_double(number: int) -> int:
+        return number + 2
+
+    comparisons = benchmark.compare_implementations(
+        slow_double, fast_double, repeat=5, min_time=0.0001
+    )
+    assert len(comparisons) == 2
+    for comparison in comparisons:
+        assert comparison.matches
+        low, high = comparison.interval
+        assert low <= comparison.speedup <= high
+        assert len(comparison.old_timings) == len(comparison.new_timings) == 5
+        assert "speedup" in str(comparison) and "MISMATCH" not in str(comparison)
+
+    raising, returning = benchmark.compare_implementations(
+        slow_double, wrong_double, repeat=2, min_time=0.0001
+    )
+    assert not raising.matches and "ValueError" in raising.difference
+    assert not returning.matches and "MISMATCH" in str(returning)
+
+    with pytest.raises(ValueError):
+        benchmark.compare_implementations(fast_double, slow_double)
+
+
+def test_speedup_interval():
+    comparison = benchmark.ImplementationComparison("example", 1, [2.0, 2.0], [1.0, 1.0])
+    assert comparison.speedup == pytest.approx(2.0)
+    assert comparison.interval == pytest.approx((2.0, 2.0))
+
+
+def test_normal_quantile():
+    assert benchmark._normal_quantile(0.5) == pytest.approx(0.0, abs=1e-9)
+    assert benchmark._normal_quantile(0.975) == pytest.approx(1.959964, abs=1e-6)
+    assert benchmark._normal_quantile(0.05) == pytest.approx(-1.644854, abs=1e-6)
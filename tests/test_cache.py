@@ -0,0 +1,129 @@
+import inspect
+import os
+import time
+from types import ModuleType
+
+import pytest
+
+from examples import cache
+from examples.registry import Examples
+
+
+class Counter:
+    """Counts calls while keeping a stable fingerprint, as its repr never changes."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __reduce__(self):
+        raise TypeError("Not picklable")
+
+    def __repr__(self):
+        return "Counter()"
+
+
+helpers = ModuleType("helpers")
+helpers.compute = lambda number: number + 1  # type: ignore
+
+
+def _counting_examples():
+    my_examples = Examples()
+    calls = Counter()
+
+    @my_examples.example(1, 2, _example_returns=3)
+    @my_examples.example(2, 2, _example_returns=4)
+    def add(number_1: int, number_2: int) -> int:
+        calls.count += 1
+        return number_1 + number_2
+
+    return my_examples, calls, add
+
+
+def test_fingerprint_changes_with_example_and_code():
+    my_examples = Examples()
+
+    @my_examples.example(1, 2)
+    @my_examples.example(2, 2)
+    def add(number_1: int, number_2: int) -> int:
+        return number_1 + number_2
+
+    first, second = my_examples.examples
+    assert cache.fingerprint(first) == cache.fingerprint(first)
+    assert cache.fingerprint(first) != cache.fingerprint(second)
+    assert cache.fingerprint(first) != cache.fingerprint(first, "salt")
+
+    original = cache.fingerprint(first)
+    add.__code__ = (lambda number_1, number_2: number_1 * number_2).__code__
+    assert cache.fingerprint(first) != original
+
+    original = cache.fingerprint(first)
+    add.__annotations__["return"] = dict
+    assert cache.fingerprint(first) != original
+    original = cache.fingerprint(first)
+    add.__signature__ = inspect.Signature()  # type: ignore
+    assert cache.fingerprint(first) != original
+
+
+def test_fingerprint_changes_with_module_attributes():
+    my_examples = Examples()
+
+    @my_examples.example(1, _example_returns=2)
+    def compute(number: int) -> int:
+        return helpers.compute(number)
+
+    (first,) = my_examples.examples
+    original, original_compute = cache.fingerprint(first), helpers.compute
+    helpers.compute = lambda number: number + 100  # type: ignore
+    try:
+        assert cache.fingerprint(first) != original
+    finally:
+        helpers.compute = original_compute  # type: ignore
+    assert cache.fingerprint(first) == original
+
+
+def test_cached_runs_skip_passing_examples(tmpdir):
+    cache_dir = str(tmpdir.join("cache"))
+    my_examples, calls, add = _counting_examples()  # registries only weakly reference `add`
+
+    my_examples.test_examples(cache_dir=cache_dir)
+    assert calls.count == 2
+    my_examples.test_examples(cache_dir=cache_dir)
+    assert calls.count == 2
+    my_examples.verify_and_test_examples(cache_dir=cache_dir, workers=2)
+    assert calls.count == 4
+    my_examples.verify_and_test_examples(cache_dir=cache_dir)
+    assert calls.count == 4
+    my_examples.test_examples(cache_dir=cache_dir, force=True)
+    assert calls.count == 6
+
+
+def test_failing_examples_are_not_cached(tmpdir):
+    cache_dir = str(tmpdir.join("cache"))
+    my_examples = Examples()
+    calls = []
+
+    @my_examples.example(_example_returns=True)
+    def fail() -> bool:
+        calls.append(1)
+        return False
+
+    for _ in range(2):
+        with pytest.raises(AssertionError):
+            my_examples.test_examples(cache_dir=cache_dir)
+    assert len(calls) == 2
+
+
+def test_prune(tmpdir):
+    result_cache = cache.ResultCache(str(tmpdir), max_age=60, max_size=None)
+    result_cache.record("old")
+    result_cache.record("new")
+    an_hour_ago = time.time() - 60 * 60
+    os.utime(str(tmpdir.join("old.json")), (an_hour_ago, an_hour_ago))
+
+    result_cache.prune()
+    assert not result_cache.passed("old")
+    assert result_cache.passed("new")
+
+    result_cache.max_size = 0
+    result_cache.prune()
+    assert not os.listdir(str(tmpdir))
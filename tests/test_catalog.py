@@ -0,0 +1,93 @@
+import subprocess  # nosec
+import sys
+
+import pytest
+
+from examples import api, catalog, registry
+
+from . import example_module_pass
+
+
+def test_export_and_load(tmpdir):
+    path = str(tmpdir.join("examples.catalog"))
+    assert catalog.export_catalog(path, [example_module_pass.__name__, "not_a_module"]) == len(
+        api.get_examples(example_module_pass)
+    )
+
+    with catalog.Catalog(path) as exported:
+        module = example_module_pass.__name__
+        assert exported.functions() == [f"{module}.add", f"{module}.multiply", f"{module}.divide"]
+        assert len(exported.get_examples(module)) == len(api.get_examples(example_module_pass))
+
+        divide = exported.get_examples(f"{module}.divide")
+        assert [example.name for example in divide] == [
+            f"{module}.divide[0]",
+            f"{module}.divide[1]",
+        ]
+        assert divide[0].returns is None and "No division support" in divide[0].raises
+        assert divide[0].rendered == str(api.get_examples(example_module_pass.divide)[0])
+        assert exported.get_examples(f"{module}.multiply")[0].returns == "6"
+
+        assert exported.doc_string(f"{module}.add") == example_module_pass.add.__doc__
+        signature, fingerprint = exported.signature(f"{module}.add")
+        assert signature == "(number_1: int, number_2: int = 1) -> int" and fingerprint
+        assert len(exported.select(package="tests", qualname="add")) == 3
+        assert exported.select(tags=["slow"]) == []
+
+        with pytest.raises(KeyError):
+            exported.get_examples(f"{module}.subtract")
+        with pytest.raises(KeyError):
+            exported.doc_string(module)
+
+
+def test_loading_without_importing(tmpdir):
+    path = str(tmpdir.join("examples.catalog"))
+    catalog.export_catalog(path, [example_module_pass.__name__])
+    loaded = subprocess.run(  # nosec
+        [
+            sys.executable,
+            "-c",
+            "import sys; from examples.catalog import Catalog; "
+            f"print(len(Catalog({path!r}).get_examples('tests.example_module_pass.add'))); "
+            "print('tests.example_module_pass' in sys.modules)",
+        ],
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    )
+    assert loaded.stdout.split() == ["3", "False"]
+
+
+def test_functions_sharing_a_qualname(tmpdir):
+    def make(number):
+        @api.example(number, _example_returns=number)
+        def identity(value: int) -> int:
+            return value
+
+        return identity
+
+    functions = [make(1), make(2), make(3)]
+    path = str(tmpdir.join("examples.catalog"))
+    try:
+        assert catalog.export_catalog(path, [__name__]) == 3
+        with catalog.Catalog(path) as exported:
+            qualname = f"{__name__}.{functions[0].__qualname__}"
+            assert exported.functions(__name__) == [qualname]
+            exported_examples = exported.get_examples(qualname)
+            assert [example.returns for example in exported_examples] == ["1", "2", "3"]
+            assert [example.name for example in exported_examples] == [
+                registry.example_id(example)
+                for function in functions
+                for example in api.get_examples(function)
+            ]
+    finally:
+        for function in functions:
+            registry.unregister(function)
+
+
+def test_not_a_catalog(tmpdir):
+    for contents in ("", "[]\n", '{"version": 0, "modules": {}}\n'):
+        path = tmpdir.join("examples.catalog")
+        path.write(contents)
+        with pytest.raises(ValueError):
+            catalog.Catalog(str(path))
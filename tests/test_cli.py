@@ -0,0 +1,66 @@
+import pytest
+
+from examples import cli
+
+
+def test_benchmark(tmpdir, capsys):
+    baseline = str(tmpdir.join("baseline.json"))
+    arguments = ["benchmark", "tests.example_module_pass", "--repeat", "2", "--min-time", "0"]
+    assert cli.main(arguments + ["--baseline", baseline, "--save"]) == 0
+    assert "tests.example_module_pass.add[0]" in capsys.readouterr().out
+    assert cli.main(arguments + ["--baseline", baseline, "--threshold", "-1"]) == 1
+
+
+def test_command_required():
+    with pytest.raises(SystemExit):
+        cli.main([])
+
+
+def test_test_shards(tmpdir, capsys):
+    durations = str(tmpdir.join("durations.json"))
+    arguments = ["test", "tests.example_module_pass", "--record-durations", durations]
+    assert cli.main(arguments) == 0
+    for index in range(2):
+        assert (
+            cli.main(
+                arguments
+                + ["--shard-index", str(index), "--shard-count", "2", "--durations", durations]
+            )
+            == 0
+        )
+
+    assert cli.main(["test", "tests.example_module_fail"]) == 1
+    assert "FAILED" in capsys.readouterr().out
+
+
+def test_test_reports(tmpdir, capsys):
+    junit_xml = str(tmpdir.join("results.xml"))
+    json_lines = str(tmpdir.join("results.jsonl"))
+    arguments = ["--junit-xml", junit_xml, "--json-lines", json_lines]
+    assert cli.main(["test", "tests.example_module_fail"] + arguments) == 1
+    assert "failed" in capsys.readouterr().out
+    assert tmpdir.join("results.xml").check() and tmpdir.join("results.jsonl").check()
+
+    assert cli.main(["test", "tests.example_module_pass", "--keep-going"]) == 0
+    assert cli.main(["test", "tests.example_module_pass", "--isolate", "--timeout", "30"]) == 0
+
+
+def test_discover(capsys):
+    assert cli.main(["discover", "tests.example_project_separate"]) == 0
+    assert "tests.example_project_separate.api_examples" in capsys.readouterr().out
+
+
+def test_load(capsys):
+    arguments = ["load", "tests.example_module_pass", "--duration", "0.1", "--qualname", "add"]
+    assert cli.main(arguments) == 0
+    output = capsys.readouterr().out
+    assert "tests.example_module_pass.add:" in output
+    assert "multiply" not in output
+
+
+def test_export(tmpdir, capsys):
+    output = str(tmpdir.join("examples.catalog"))
+    assert cli.main(["export", "tests.example_module_pass", "--output", output]) == 0
+    assert "Exported 7 examples" in capsys.readouterr().out
+    assert tmpdir.join("examples.catalog").check()
+    assert cli.main(["export", "tests.no_examples_module", "--output", output]) == 1
@@ -0,0 +1,60 @@
+import pytest
+
+from examples import api
+from examples.comparison import compare
+
+
+class Version:
+    def __init__(self, text):
+        self.text = text
+
+
+@compare.register(Version)
+def _compare_versions(expected, actual, tolerance=None):
+    return None if expected.text == actual.text else f"{expected.text} != {actual.text}"
+
+
+def test_compare():
+    assert compare(1, 1) is None
+    assert compare(0.1 + 0.2, 0.3) is not None
+    assert compare(0.1 + 0.2, 0.3, tolerance=1e-9) is None
+    difference = compare([1, {"a": (1.0, 2.0)}], [1, {"a": (1.0, 2.5)}])
+    assert difference == "[1]: ['a']: [1]: expected 2.0, got 2.5"
+    assert compare([1, 2], [1, 2, 3]) == "expected 2 items, got 3"
+    assert compare([1], (1,)) is not None
+    assert "missing keys ['b']" in compare({"a": 1, "b": 2}, {"a": 1})
+    assert "missing items [3]" in compare({1, 2, 3}, {1, 2})
+    assert compare("abcdef", "abcxef") == "expected 'def' at position 3, got 'xef'"
+    assert compare(b"abc", memoryview(b"abc")) is None
+    assert compare(Version("1.0"), Version("1.0")) is None
+    assert compare(Version("1.0"), Version("2.0")) == "1.0 != 2.0"
+
+    difference = compare(list(range(1_000_000)), list(range(1_000_000 - 1)) + [0])
+    assert difference == "[999999]: expected 999999, got 0"
+    assert len(compare(list(range(100_000)), [])) < 100
+
+
+def test_tolerance_examples():
+    @api.example(0.1, 0.2, _example_returns=0.3, _example_tolerance=1e-9)
+    def add(number_1: float, number_2: float) -> float:
+        return number_1 + number_2
+
+    api.verify_and_test_examples(add)
+
+    @api.example(list(range(100_000)), _example_returns=[0] * 100_000)
+    def copy(numbers: list) -> list:
+        return list(numbers)
+
+    with pytest.raises(AssertionError) as failure:
+        api.test_examples(copy)
+    assert "[1]: expected 0, got 1" in str(failure.value)
+    assert len(str(failure.value)) < 3000
+
+
+def test_compare_arrays():
+    numpy = pytest.importorskip("numpy")
+    assert compare(numpy.arange(5), numpy.arange(5)) is None
+    assert compare(numpy.zeros(3), numpy.array([0.0, 1e-12, 0.0]), tolerance=1e-9) is None
+    assert "1 of 3 elements differ" in compare(numpy.zeros(3), numpy.array([0.0, 1.0, 0.0]))
+    assert "shape" in compare(numpy.zeros(3), numpy.zeros(4))
+    assert compare([numpy.arange(2)], [numpy.arange(2)]) is None
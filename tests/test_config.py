@@ -0,0 +1,39 @@
+import pytest
+
+import examples
+from examples import api, config, registry
+from examples.registry import Examples
+
+
+@pytest.fixture
+def disabled_examples():
+    examples.configure(enabled=False)
+    yield
+    examples.configure(enabled=True)
+
+
+def test_disabled_examples_leave_functions_untouched(disabled_examples):
+    assert not config.enabled
+    module_examples = registry.module_registry.get(__name__, None)
+
+    @api.example(1, 2, _example_returns=3)
+    def add(number_1: int, number_2: int) -> int:
+        return number_1 + number_2
+
+    assert api.add_example_to(add)(2, 2, _example_returns=4) is None
+
+    my_examples = Examples()
+
+    @my_examples.example(1, 2)
+    def multiply(number_1: int, number_2: int) -> int:
+        return number_1 * number_2
+
+    assert add.__doc__ is None and multiply.__doc__ is None
+    assert api.get_examples(add) == []
+    assert not my_examples.examples
+    assert registry.module_registry.get(__name__, None) is module_examples
+
+
+def test_configure_without_changes():
+    examples.configure()
+    assert config.enabled
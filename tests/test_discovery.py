@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+from examples import discovery, get_examples
+
+from .example_project_separate import api
+
+
+def test_discover_separate_project():
+    timings = discovery.discover("tests.example_project_separate", workers=2)
+    assert list(timings) == ["tests.example_project_separate.api_examples"]
+    assert all(seconds >= 0 for seconds in timings.values())
+    assert get_examples(api.add)
+
+    with pytest.raises(ValueError):
+        discovery.discover("tests.example_module_pass")
+
+
+def test_discovery_cache(tmpdir, monkeypatch):
+    monkeypatch.setattr(discovery, "_directory_cache", {})
+    package = tmpdir.mkdir("discovered_package")
+    package.join("__init__.py").write("")
+    package.join("api.py").write("def double(number: int) -> int:\n    return number * 2\n")
+    package.mkdir("nested").join("__init__.py").write("")
+    package.join("nested").join("more_examples.py").write("")
+    monkeypatch.syspath_prepend(str(tmpdir))
+
+    cache_file = str(tmpdir.join("discovery.json"))
+    assert list(discovery.discover("discovered_package", cache_file=cache_file)) == [
+        "discovered_package.nested.more_examples"
+    ]
+    discovery._directory_cache.clear()
+    discovery.load_cache(cache_file)
+    assert str(package) in discovery._directory_cache
+
+    package.join("api_examples.py").write(
+        "from examples import add_example_to\n"
+        "from .api import double\n"
+        "add_example_to(double)(2, _example_returns=4)\n"
+    )
+    modified = os.stat(str(package)).st_mtime_ns + 1_000_000_000
+    os.utime(str(package), ns=(modified, modified))
+    assert list(discovery.discover("discovered_package", cache_file=cache_file)) == [
+        "discovered_package.api_examples",
+        "discovered_package.nested.more_examples",
+    ]
@@ -0,0 +1,51 @@
+import pickle
+
+import pytest
+
+from examples import mapped
+from examples.cache import fingerprint
+from examples.registry import Examples
+
+
+def first_bytes(data: memoryview) -> bytes:
+    return bytes(data[:4])
+
+
+def test_mapped_binary_file(tmpdir):
+    data_file = tmpdir.join("data.bin")
+    data_file.write_binary(b"abcdefgh")
+    expected_file = tmpdir.join("expected.bin")
+    expected_file.write_binary(b"abcd")
+
+    module_examples = Examples()
+    module_examples.example(mapped(str(data_file)), _example_returns=mapped(str(expected_file)))(
+        first_bytes
+    )
+    example = module_examples.examples[0]
+    assert f"mapped({str(data_file)!r})" in str(example)
+    assert "abcdefgh" not in str(example)
+    assert "mapped(" in first_bytes.__doc__
+
+    module_examples.verify_and_test_examples(verify_types=False)
+    module_examples.test_examples(verify_return_type=False, workers=2, backend="process")
+
+    copied = pickle.loads(pickle.dumps(example.args[0]))
+    assert bytes(copied.resolve()) == b"abcdefgh"
+
+    before = fingerprint(example)
+    data_file.write_binary(b"abcdefghij")
+    assert fingerprint(example) != before
+
+
+def test_mapped_numpy_file(tmpdir):
+    numpy = pytest.importorskip("numpy")
+    array_file = str(tmpdir.join("array.npy"))
+    numpy.save(array_file, numpy.arange(10))
+
+    array = mapped(array_file, cache=False).resolve()
+    assert isinstance(array, numpy.memmap)
+    assert array.sum() == 45
+
+    raw_file = str(tmpdir.join("array.bin"))
+    numpy.arange(4, dtype="int32").tofile(raw_file)
+    assert list(mapped(raw_file, dtype="int32", shape=(4,)).resolve()) == [0, 1, 2, 3]
@@ -0,0 +1,56 @@
+import os
+import time
+
+import pytest
+
+from examples import api, isolation
+from examples.registry import Examples
+
+from . import example_module_fail, example_module_pass
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "fork"), reason="Isolation requires forking worker processes."
+)
+
+
+def test_isolated_examples():
+    results = api.test_examples(example_module_pass, isolate=True, workers=2, fail_fast=False)
+    assert results.failed == 0 and len(results) == len(api.get_examples(example_module_pass))
+    api.test_examples(example_module_pass, isolate=True)
+
+    results = api.test_examples(example_module_fail, isolate=True, fail_fast=False)
+    assert results.failed
+    with pytest.raises(AssertionError):
+        api.test_examples(example_module_fail, isolate=True)
+
+
+def test_hanging_and_crashing_examples():
+    my_examples = Examples()
+
+    @my_examples.example()
+    def hangs() -> None:
+        time.sleep(60)
+
+    @my_examples.example()
+    def crashes() -> None:
+        os._exit(70)  # as a crash within native code would, without running cleanup
+
+    @my_examples.example(_example_returns=1)
+    def works() -> int:
+        return 1
+
+    start = time.perf_counter()
+    results = my_examples.test_examples(isolate=True, timeout=0.5, fail_fast=False)
+    assert time.perf_counter() - start < 30
+
+    hung, crashed, passed = results
+    assert passed.passed
+    assert hung.error_type == "TimeoutError" and "hangs" in hung.message
+    assert crashed.error_type == "WorkerCrashed" and "code 70" in crashed.message
+
+
+def test_workers_are_reused():
+    examples = api.get_examples(example_module_pass)
+    outcomes = isolation.run_isolated(examples, lambda example: (float(os.getpid()), None))
+    assert len({seconds for seconds, _ in outcomes}) == 1
+    assert os.getpid() not in {seconds for seconds, _ in outcomes}
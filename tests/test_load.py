@@ -0,0 +1,49 @@
+import asyncio
+
+from examples import load
+from examples.registry import Examples
+
+from . import example_module_pass
+
+
+def test_replay_module_examples():
+    results = load.replay_examples(example_module_pass, duration=0.2, concurrency=2)
+    assert [result.name for result in results] == [
+        "tests.example_module_pass.add",
+        "tests.example_module_pass.divide",
+        "tests.example_module_pass.multiply",
+    ]
+    for result in results:
+        assert result.calls > 0
+        assert result.errors == 0
+        assert result.p50 <= result.p95 <= result.p99
+        assert result.throughput > 0
+        assert "calls" in str(result)
+
+
+def test_replay_at_rate():
+    module_examples = Examples()
+
+    @module_examples.example(1)
+    def sync_identity(value: int) -> int:
+        return value
+
+    @module_examples.example(1)
+    async def async_identity(value: int) -> int:
+        await asyncio.sleep(0)
+        return value
+
+    @module_examples.example()
+    def failing():
+        raise ValueError("broken")
+
+    results = {
+        result.name.rsplit(".", 1)[-1]: result
+        for result in load.replay_examples(
+            module_examples.examples, duration=0.5, concurrency=2, rate=60
+        )
+    }
+    assert set(results) == {"sync_identity", "async_identity", "failing"}
+    total_calls = sum(result.calls for result in results.values())
+    assert 15 <= total_calls <= 31
+    assert results["failing"].errors == results["failing"].calls
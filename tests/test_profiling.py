@@ -0,0 +1,88 @@
+import os
+import pstats
+import time
+import tracemalloc
+
+from examples import api, hooks, profiling
+from examples.hooks import ExampleHook
+from examples.registry import Examples
+
+from . import example_module_pass
+
+
+class RecordingHook(ExampleHook):
+    def __init__(self):
+        self.calls = []
+
+    def before(self, example):
+        self.calls.append(("before", example))
+
+    def after(self, example, seconds, exception):
+        assert seconds >= 0
+        self.calls.append(("after", example, exception))
+
+
+def test_hooks_surround_example_calls():
+    hook = RecordingHook()
+    example = api.get_examples(example_module_pass.divide)[0]
+    with hooks.using_hooks(hook):
+        example.test()
+    assert not hooks.installed
+
+    (before, before_example), (after, after_example, exception) = hook.calls
+    assert before_example is after_example is example
+    assert isinstance(exception, NotImplementedError)
+
+
+def test_hooks_for_gathered_async_examples():
+    @api.example(1, _example_returns=1)
+    async def identity(number: int) -> int:
+        return number
+
+    hook = RecordingHook()
+    api.test_examples(identity, gather_async=True, hooks=[hook])
+    assert [call[0] for call in hook.calls] == ["before", "after"]
+
+
+def test_profile_hook(tmpdir):
+    hook = profiling.ProfileHook(str(tmpdir))
+    assert "No examples" in hook.summary()
+
+    api.test_examples(example_module_pass, hooks=[hook])
+    profiles = os.listdir(str(tmpdir))
+    assert "tests.example_module_pass.add[0].prof" in profiles
+    pstats.Stats(str(tmpdir.join("tests.example_module_pass.add[0].prof")))
+    assert "example_module_pass.py" in hook.summary()
+
+
+def test_allocation_hook(tmpdir):
+    hook = profiling.AllocationHook(str(tmpdir))
+    assert "No example" in hook.summary()
+
+    def allocate(size: int):
+        return bytearray(size)
+
+    api.add_example_to(allocate)(100000)
+    api.test_examples(allocate, hooks=[hook])
+    assert not tracemalloc.is_tracing()
+
+    snapshot_name = f"{__name__}.test_allocation_hook._locals_.allocate[0].snapshot"
+    assert snapshot_name in os.listdir(str(tmpdir))
+    tracemalloc.Snapshot.load(str(tmpdir.join(snapshot_name)))
+    assert "test_profiling.py" in hook.summary()
+
+
+def test_allocation_hook_in_thread_pools(tmpdir):
+    my_examples = Examples()
+
+    @my_examples.example(0.3)
+    @my_examples.example(0.1)
+    def sleep_and_allocate(seconds: float) -> int:
+        time.sleep(seconds)
+        return len(bytearray(100000))
+
+    hook = profiling.AllocationHook(str(tmpdir))
+    results = my_examples.test_examples(workers=2, hooks=[hook], fail_fast=False)
+    assert results.failed == 0 and len(results) == 2
+    assert not tracemalloc.is_tracing()
+    assert os.listdir(str(tmpdir))
@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+pytest_plugins = ["pytester"]
+
+EXAMPLE_MODULE = """
+from examples import example
+
+
+@example(1, _example_returns=2)
+@example(2, _example_returns=5)
+def increment(number: int) -> int:
+    return number + 1
+"""
+
+
+@pytest.fixture(autouse=True)
+def importable_examples(monkeypatch):
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    monkeypatch.setenv("PYTHONPATH", package_root)
+
+
+def test_examples_collected_as_items(pytester):
+    pytester.makepyfile(incremented=EXAMPLE_MODULE)
+    result = pytester.runpytest_subprocess(
+        "-p", "examples.pytest_plugin", "--examples-module", "incremented", "--collect-only", "-q"
+    )
+    result.stdout.fnmatch_lines(
+        ["examples::incremented.increment[[]0[]]", "examples::incremented.increment[[]1[]]"]
+    )
+
+
+def test_example_items_run(pytester):
+    pytester.makepyfile(incremented=EXAMPLE_MODULE)
+    pytester.makeini("[pytest]\nexamples_modules = incremented\n")
+    result = pytester.runpytest_subprocess("-p", "examples.pytest_plugin")
+    result.assert_outcomes(passed=1, failed=1)
+
+    result = pytester.runpytest_subprocess("-p", "examples.pytest_plugin", "--lf")
+    result.assert_outcomes(failed=1)
+
+    result = pytester.runpytest_subprocess("-p", "examples.pytest_plugin", "-k", "increment and 1")
+    result.assert_outcomes(passed=1, deselected=1)
+
+
+def test_disabled_by_default(pytester):
+    pytester.makepyfile(incremented=EXAMPLE_MODULE, test_nothing="def test_nothing(): pass")
+    result = pytester.runpytest_subprocess("-p", "examples.pytest_plugin")
+    result.assert_outcomes(passed=1)
@@ -1,3 +1,9 @@
+import gc
+import weakref
+
+import examples
+from examples import registry
+from examples.example_objects import CallableExample
 from examples.registry import Examples
 
 
@@ -18,3 +24,119 @@ def test_doc_strings():
         return number_1 + number_2
 
     assert not add_docless.__doc__
+
+
+def test_lazy_doc_strings():
+    examples.configure(lazy_doc_strings=True)
+    try:
+        my_examples = Examples()
+
+        @my_examples.example(1, 2)
+        @my_examples.example(2, 3, _example_returns=5)
+        def add(number_1: int, number_2: int) -> int:
+            """Adds two numbers."""
+            return number_1 + number_2
+
+        assert add.__doc__ == "Adds two numbers."
+    finally:
+        examples.configure(lazy_doc_strings=False)
+
+    my_examples.render_docs()
+    rendered = add.__doc__
+    assert rendered.count("Examples:") == 1 and rendered.count("-------") == 2
+
+    my_examples.render_docs()
+    assert add.__doc__ is rendered
+
+
+def test_doc_strings_cap_large_values():
+    my_examples = Examples()
+
+    @my_examples.example(list(range(100000)), _example_returns="x" * 100000)
+    def count(numbers: list) -> str:
+        return "x" * len(numbers)
+
+    assert len(count.__doc__) < 1000
+    assert "..." in count.__doc__
+
+
+def test_doc_strings_render_ordinary_values_in_full():
+    my_examples = Examples()
+    numbers, text, mapping = list(range(17)), "y" * 161, {"b": 1, "a": 2}
+
+    @my_examples.example(numbers, text, mapping=mapping)
+    def identity(numbers: list, text: str, mapping: dict) -> list:
+        return numbers
+
+    for value in (numbers, text, mapping):
+        assert repr(value) in identity.__doc__
+
+
+def test_unregister_and_clear():
+    my_examples = Examples()
+
+    @my_examples.example(1)
+    @my_examples.example(2)
+    def identity(value: int) -> int:
+        return value
+
+    my_examples.example("text", _example_doc_string=False)(len)  # can't be weakly referenced
+    assert len(my_examples.examples) == 3 and my_examples.functions == [identity, len]
+
+    my_examples.unregister(identity)
+    assert my_examples.get(identity) == [] and len(my_examples.examples) == 1
+    my_examples.clear()
+    assert my_examples.examples == []
+
+    @examples.example(1)
+    def module_identity(value: int) -> int:
+        return value
+
+    assert examples.get_examples(module_identity)
+    registry.unregister(module_identity)
+    assert not examples.get_examples(module_identity)
+
+
+def _live_examples() -> int:
+    gc.collect()
+    return sum(1 for item in gc.get_objects() if isinstance(item, CallableExample))
+
+
+def test_examples_do_not_keep_functions_alive():
+    def make_function(index: int):
+        @examples.example(bytearray(1024), index, _example_returns=index)
+        def dynamic_function(data: bytearray, number: int) -> int:
+            return number
+
+        return weakref.ref(dynamic_function)
+
+    live_before = _live_examples()
+    for index in range(100000):
+        last_function = make_function(index)
+    assert _live_examples() - live_before < 100
+
+    assert last_function() is None
+    assert len(registry.module_registry[__name__].examples) < 100
+
+
+def test_example_ids_of_functions_sharing_a_qualname():
+    def make(number):
+        @examples.example(number, _example_returns=number)
+        @examples.example(0, _example_returns=0)
+        def identity(value: int) -> int:
+            return value
+
+        return identity
+
+    functions = [make(1), make(2)]
+    try:
+        ids = [
+            registry.example_id(example)
+            for function in functions
+            for example in examples.get_examples(function)
+        ]
+        prefix = f"{__name__}.test_example_ids_of_functions_sharing_a_qualname.<locals>.make"
+        assert ids == [f"{prefix}.<locals>.identity[{index}]" for index in range(4)]
+    finally:
+        for function in functions:
+            registry.unregister(function)
@@ -0,0 +1,72 @@
+import asyncio
+import json
+from xml.etree import ElementTree
+
+import pytest
+
+from examples import api
+from examples.registry import Examples
+
+from . import example_module_fail, example_module_pass
+
+
+def test_collect_every_failure():
+    with pytest.raises(Exception):
+        api.verify_and_test_examples(example_module_fail)
+
+    results = api.verify_and_test_examples(example_module_fail, fail_fast=False)
+    assert len(results) == len(api.get_examples(example_module_fail))
+    assert results.failed > 1
+    assert results.passed + results.failed == len(results)
+    assert results.modules == [example_module_fail.__name__]
+    assert all(failure.error_type for failure in results.failures())
+    with pytest.raises(AssertionError):
+        results.raise_for_failures()
+
+    passing = api.test_examples(example_module_pass, fail_fast=False)
+    assert passing.failed == 0
+    assert all(result.passed and result.seconds >= 0 for result in passing)
+    passing.raise_for_failures()
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_collect_in_pool(backend):
+    results = api.verify_and_test_examples(
+        example_module_fail, fail_fast=False, workers=2, backend=backend
+    )
+    serial = api.verify_and_test_examples(example_module_fail, fail_fast=False)
+    assert results.names == serial.names
+    assert results.errors == serial.errors
+
+
+def test_collect_gathered():
+    module_examples = Examples()
+
+    @module_examples.example(1, _example_returns=1)
+    @module_examples.example(2, _example_returns=3)
+    async def echo(value: int) -> int:
+        await asyncio.sleep(0)
+        return value
+
+    results = module_examples.test_examples(fail_fast=False, gather_async=True)
+    assert len(results) == 2
+    assert results.failed == 1
+    assert results[-1].passed is not results[0].passed
+
+
+def test_export(tmpdir):
+    results = api.verify_and_test_examples(example_module_fail, fail_fast=False)
+
+    json_lines = str(tmpdir.join("results.jsonl"))
+    results.write_json_lines(json_lines)
+    with open(json_lines) as json_file:
+        rows = [json.loads(line) for line in json_file]
+    assert [row["passed"] for row in rows] == [result.passed for result in results]
+    assert rows[0]["module"] == example_module_fail.__name__
+
+    junit_xml = str(tmpdir.join("results.xml"))
+    results.write_junit_xml(junit_xml)
+    suite = ElementTree.parse(junit_xml).getroot()
+    assert suite.get("tests") == str(len(results))
+    assert suite.get("failures") == str(results.failed)
+    assert len(suite.findall("testcase/failure")) == results.failed
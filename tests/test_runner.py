@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from examples import api, registry, runner
+from examples.registry import Examples
+
+from . import example_module_fail, example_module_pass
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_parallel_module_examples(backend):
+    module_examples = registry.module_registry[example_module_pass.__name__]
+    module_examples.test_examples(workers=2, backend=backend)
+    module_examples.verify_and_test_examples(workers=2, backend=backend)
+
+    with pytest.raises(Exception):
+        registry.module_registry[example_module_fail.__name__].test_examples(
+            workers=2, backend=backend
+        )
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_parallel_all_examples(backend):
+    with pytest.raises(Exception):
+        api.test_all_examples(workers=2, backend=backend)
+    with pytest.raises(Exception):
+        api.verify_and_test_all_examples(workers=2, backend=backend)
+
+
+def test_unpicklable_examples_run_in_parent_process():
+    local_examples = Examples()
+    called_with = []
+
+    @local_examples.example(1, _example_returns=1)
+    @local_examples.example(2, _example_returns=2)
+    def record(number: int) -> int:
+        called_with.append(number)
+        return number
+
+    local_examples.test_examples(workers=2, backend="process")
+    assert sorted(called_with) == [1, 2]
+
+
+def test_async_examples_in_threads():
+    local_examples = Examples()
+
+    @local_examples.example(1, _example_returns=1)
+    async def identity(number: int) -> int:
+        return number
+
+    local_examples.test_examples(workers=2)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        runner.run_tests([], workers=2, backend="cluster")
+
+
+def _concurrency_tracking_examples():
+    local_examples = Examples()
+    running = {"now": 0, "most": 0}
+
+    @local_examples.example(0.01, _example_returns=0.01)
+    @local_examples.example(0.02, _example_returns=0.02)
+    @local_examples.example(0.01, _example_returns=0.01)
+    @local_examples.example(0.02, _example_returns=0.02)
+    async def wait(seconds: float) -> float:
+        running["now"] += 1
+        running["most"] = max(running["most"], running["now"])
+        await asyncio.sleep(seconds)
+        running["now"] -= 1
+        return seconds
+
+    @local_examples.example(1, _example_returns=1)
+    def identity(number: int) -> int:
+        return number
+
+    return local_examples, running
+
+
+def test_gather_async_examples():
+    local_examples, running = _concurrency_tracking_examples()
+    local_examples.test_examples()
+    assert running["most"] == 1
+
+    local_examples, running = _concurrency_tracking_examples()
+    local_examples.verify_and_test_examples(gather_async=True)
+    assert running["most"] == 4
+
+    local_examples, running = _concurrency_tracking_examples()
+    local_examples.test_examples(gather_async=True, async_limit=2)
+    assert running["most"] == 2
+
+
+def test_gather_async_timeout():
+    local_examples = Examples()
+
+    @local_examples.example(_example_raises=ValueError)
+    async def fail():
+        raise ValueError()
+
+    @local_examples.example()
+    async def hang():
+        await asyncio.sleep(10)
+
+    with pytest.raises(AssertionError):
+        local_examples.test_examples(gather_async=True, async_timeout=0.05)
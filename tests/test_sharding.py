@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from examples import api, registry, sharding
+
+from . import example_module_pass
+
+
+def test_shards_are_disjoint_and_complete():
+    examples = api.get_examples(example_module_pass)
+    shards = [sharding.shard(examples, index, 3) for index in range(3)]
+    assert sorted(id(example) for shard in shards for example in shard) == sorted(
+        id(example) for example in examples
+    )
+    assert sharding.shard(examples, 1, 3) == shards[1]
+
+    with pytest.raises(ValueError):
+        sharding.shard(examples, 3, 3)
+
+
+def test_shards_balanced_by_durations():
+    examples = api.get_examples(example_module_pass)
+    names = [registry.example_id(example) for example in examples]
+    durations = {name: 1.0 for name in names}
+    durations[names[0]] = 10.0
+
+    shards = [sharding.shard(examples, index, 2, durations=durations) for index in range(2)]
+    assert shards[0] == [examples[0]]
+    assert shards[1] == examples[1:]
+
+
+def test_record_and_use_durations(tmpdir):
+    durations = str(tmpdir.join("durations.json"))
+    api.verify_and_test_examples(example_module_pass, record_durations=durations)
+    with open(durations) as durations_file:
+        recorded = json.load(durations_file)["durations"]
+    assert "tests.example_module_pass.add[0]" in recorded
+
+    for index in range(2):
+        api.verify_and_test_examples(
+            example_module_pass, shard_index=index, shard_count=2, durations=durations
+        )
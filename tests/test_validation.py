@@ -0,0 +1,44 @@
+import pytest
+
+from examples import api
+from examples.validation import get_validator
+
+
+def test_validator_is_reused_across_examples():
+    @api.example(1, 2)
+    @api.example(3, 4)
+    def add(number_1: int, number_2: int) -> int:
+        return number_1 + number_2
+
+    validator = get_validator(add)
+    api.verify_signatures(add)
+    assert get_validator(add) is validator
+    assert validator.model(("number_1", "number_2")) is validator.model(("number_1", "number_2"))
+
+
+def test_validator_is_invalidated_when_function_changes():
+    def add(number_1: int, number_2: int) -> int:
+        return number_1 + number_2
+
+    validator = get_validator(add)
+    validator.validate({"number_1": 1, "number_2": 2})
+
+    add.__annotations__["number_2"] = dict
+    changed_validator = get_validator(add)
+    assert changed_validator is not validator
+    with pytest.raises(Exception):
+        changed_validator.validate({"number_1": 1, "number_2": 2})
+
+
+def test_batched_return_validation_points_to_failing_example():
+    @api.example(1, _example_returns=1)
+    @api.example("not a number")
+    @api.example(2, _example_returns=2)
+    def identity(value) -> int:
+        return value
+
+    with pytest.raises(AssertionError) as error:
+        api.test_examples(identity)
+    assert "'not a number'" in str(error.value)
+
+    api.test_examples(identity, verify_return_type=False)
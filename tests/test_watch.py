@@ -0,0 +1,54 @@
+import importlib
+import os
+
+from examples import registry, watch
+
+IMPLEMENTATION = """
+def triple(number: int) -> int:
+    return number * {factor}
+"""
+
+COMPANION = """
+from examples import add_example_to
+
+from .watched import triple
+
+add_example_to(triple)(2, _example_returns=6)
+"""
+
+
+def _touch(path):
+    modified = os.stat(path).st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(modified, modified))
+
+
+def test_watcher_reruns_changed_modules(tmpdir, monkeypatch):
+    package = tmpdir.mkdir("watched_package")
+    package.join("__init__.py").write("")
+    package.join("watched.py").write(IMPLEMENTATION.format(factor=3))
+    package.join("watched_examples.py").write(COMPANION)
+    monkeypatch.syspath_prepend(str(tmpdir))
+    importlib.import_module("watched_package.watched_examples")
+
+    outputs = []
+    watcher = watch.Watcher()
+    assert watcher.run_changed(output=outputs.append) is None
+
+    package.join("watched.py").write(IMPLEMENTATION.format(factor=2))
+    _touch(str(package.join("watched.py")))
+    assert watcher.changed() == ["watched_package.watched"]
+    _touch(str(package.join("watched.py")))
+    assert watcher.run_changed(output=outputs.append) >= 0
+    assert "0 passed, 1 failed" in outputs[-1]
+    assert len(registry.module_registry["watched_package.watched"].examples) == 1
+
+    package.join("watched.py").write(IMPLEMENTATION.format(factor=3))
+    _touch(str(package.join("watched_examples.py")))
+    _touch(str(package.join("watched.py")))
+    watcher.run_changed(output=outputs.append)
+    assert "1 passed, 0 failed" in outputs[-1]
+
+    package.join("watched.py").write("def triple(")
+    _touch(str(package.join("watched.py")))
+    watcher.run_changed(output=outputs.append)
+    assert any("Failed to reload watched_package.watched" in output for output in outputs)